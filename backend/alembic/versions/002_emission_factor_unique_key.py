@@ -0,0 +1,23 @@
+"""Unique key on emission factors for upserts
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_unique_constraint(
+        'uq_emission_factors_key',
+        'emission_factors',
+        ['name', 'source', 'category', 'region', 'year']
+    )
+
+def downgrade():
+    op.drop_constraint('uq_emission_factors_key', 'emission_factors', type_='unique')
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Boolean, func, Text, Enum, JSON
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Boolean, func, Text, Enum, JSON, UniqueConstraint
 from sqlalchemy.orm import relationship, declarative_base
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship, declarative_base, backref
@@ -53,6 +53,10 @@ class EmissionFactor(Base):
     last_updated = Column(DateTime, default=datetime.utcnow)
     is_active = Column(Boolean, default=True)
     
+    __table_args__ = (
+        UniqueConstraint('name', 'source', 'category', 'region', 'year', name='uq_emission_factors_key'),
+    )
+    
     # Relationships
     emission_records = relationship('EmissionRecord', back_populates='emission_factor')
 
@@ -3,6 +3,8 @@ import pandas as pd
 from typing import Dict, List, Optional, Tuple
 from scipy.optimize import minimize, differential_evolution
 from scipy.optimize import linprog
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import logging
 
 logger = logging.getLogger(__name__)
@@ -182,7 +184,11 @@ class CarbonReductionOptimizer:
                 bounds,
                 seed=42,
                 maxiter=100,
-                popsize=15
+                popsize=15,
+                tol=0.05,
+                mutation=(0.3, 1.0),
+                recombination=0.9,
+                polish=False  # L-BFGS-B polish is meaningless for a binary selection
             )
             
             if result.success:
@@ -265,7 +271,11 @@ class CarbonReductionOptimizer:
                 multi_objective,
                 bounds,
                 seed=42,
-                maxiter=150
+                maxiter=150,
+                tol=0.05,
+                mutation=(0.3, 1.0),
+                recombination=0.9,
+                polish=False
             )
             
             if result.success:
@@ -309,8 +319,13 @@ class CarbonReductionOptimizer:
             logger.error(f"Error in multi-objective optimization: {e}")
             raise
     
-    def run_all_optimizations(self) -> Dict:
-        """Run all optimization methods and compare results"""
+    def run_all_optimizations(self, max_workers: int = 1) -> Dict:
+        """
+        Run all optimization methods and compare results
+        
+        max_workers: Solvers run in that many worker processes when above 1; they are
+            independent, so the phase then takes about as long as the slowest one
+        """
         try:
             methods = [
                 ('cost_effectiveness', self.cost_effectiveness_optimization),
@@ -319,15 +334,35 @@ class CarbonReductionOptimizer:
                 ('multi_objective', self.multi_objective_optimization)
             ]
             
+            if max_workers > 1:
+                # Spawned rather than forked workers: forking after BLAS/Numba threads have
+                # started can deadlock. Leaving the block waits for every solver; failures
+                # surface from result() below
+                with ProcessPoolExecutor(
+                    max_workers=min(max_workers, len(methods)),
+                    mp_context=multiprocessing.get_context('spawn')
+                ) as executor:
+                    futures = []
+                    for method_name, method_func in methods:
+                        logger.info(f"Running {method_name} optimization...")
+                        futures.append(executor.submit(method_func))
+                outcomes = [future.result for future in futures]
+            else:
+                outcomes = [method_func for _, method_func in methods]
+            
             results = {}
             best_method = None
             best_score = -float('inf')
             
-            for method_name, method_func in methods:
-                logger.info(f"Running {method_name} optimization...")
+            # Results are compared in method order so ties resolve the same either way
+            for (method_name, _), outcome in zip(methods, outcomes):
+                if max_workers > 1:
+                    logger.info(f"Collected {method_name} optimization result")
+                else:
+                    logger.info(f"Running {method_name} optimization...")
                 
                 try:
-                    result = method_func()
+                    result = outcome()
                     results[method_name] = result
                     
                     # Compare based on target achievement and budget utilization
@@ -1,14 +1,185 @@
-import pandas as pd
+import copy
+import math
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
-from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.preprocessing import StandardScaler
-from sklearn.cluster import KMeans
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Categorical codes shared by feature extraction and the column arrays
+_LEVEL_CODES = {'Low': 1, 'Medium': 2, 'High': 3}
+_TIMEFRAME_CODES = {'Short': 1, 'Medium': 2, 'Long': 3}
+
+# Feature encodings (simplified)
+_MATURITY_CODES = {'Starter': 1, 'Beginner': 2, 'Intermediate': 3, 'Advanced': 4}
+_CATEGORY_CODES = {
+    'Energy Efficiency': 1, 'Renewable Energy': 2, 'Transportation': 3,
+    'Waste Management': 4, 'Water Conservation': 5, 'Green Building': 6,
+    'Supply Chain': 7, 'Other': 0
+}
+
+# Industries given a binary applicability feature on each initiative
+_TOP_INDUSTRIES = ('Technology', 'Manufacturing', 'Energy', 'Transportation')
+
+_INITIATIVE_FEATURE_COUNT = 7 + len(_TOP_INDUSTRIES)
+
+# Company profiles are described in the initiative feature space, as the initiative
+# that would suit them best, so both sides share one fitted scaler:
+# the dominant emission scope picks the category,
+_SCOPE_CATEGORIES = {
+    'scope1': 'Energy Efficiency', 'scope2': 'Renewable Energy', 'scope3': 'Supply Chain'
+}
+# maturity sets the implementation time and complexity a company can take on,
+_MATURITY_PACE = {'Starter': 1, 'Beginner': 1, 'Intermediate': 2, 'Advanced': 3}
+# and risk tolerance sets how long a payback it accepts
+_RISK_ROI_TIMEFRAME = {'Low': 1, 'Medium': 2, 'High': 3}
+_HIGH_EMITTER_THRESHOLD = 10000
+
+# Static recommendation metadata shared by every response
+_METHODS_USED = ('content_based', 'collaborative', 'rules_based')
+_EXISTING_FILTER = ('existing_initiatives',)
+
+
+
+def _build_roadmap(impl_duration: str) -> Dict:
+    """Build the phased implementation roadmap for a given implementation duration"""
+    phases = [
+        # Phase 1: Planning
+        {
+            'phase': 'Planning & Assessment',
+            'duration': '2-4 weeks',
+            'activities': [
+                'Conduct detailed feasibility study',
+                'Stakeholder alignment',
+                'Budget approval',
+                'Resource allocation'
+            ]
+        },
+        # Phase 2: Implementation
+        {
+            'phase': 'Implementation',
+            'duration': impl_duration,
+            'activities': [
+                'Project kickoff',
+                'System deployment/changes',
+                'Staff training',
+                'Initial testing'
+            ]
+        },
+        # Phase 3: Monitoring
+        {
+            'phase': 'Monitoring & Optimization',
+            'duration': 'Ongoing',
+            'activities': [
+                'Performance tracking',
+                'Regular reporting',
+                'Continuous improvement',
+                'Impact measurement'
+            ]
+        }
+    ]
+    
+    return {
+        'phases': phases,
+        'total_timeline': impl_duration,
+        'key_milestones': [
+            'Feasibility study complete',
+            'Implementation 50% complete',
+            'Full deployment',
+            'First impact measurement'
+        ]
+    }
+
+
+# Roadmaps are deterministic per implementation time, so build them once
+_ROADMAP_TEMPLATES = {
+    'Short': _build_roadmap('1-3 months'),
+    'Medium': _build_roadmap('3-9 months'),
+    'Long': _build_roadmap('9-18 months')
+}
+_DEFAULT_ROADMAP = _build_roadmap('3-6 months')
+
+# Catalog size from which the compiled scoring kernel beats NumPy dispatch
+_NUMBA_MIN_INITIATIVES = 10000
+
+
+def _score_rules_and_confidence(
+    cost_codes, complexity_codes, impact_codes, time_codes,
+    industry_match, size_match, budget_bonus, budget_code,
+    maturity_code, high_emitter
+):
+    """Rules-based score and profile-fit confidence for every initiative in one pass"""
+    n = cost_codes.shape[0]
+    scores = np.empty(n)
+    confidence = np.empty(n)
+    
+    for i in range(n):
+        score = 0.5
+        if maturity_code == 1 and complexity_codes[i] == 1:
+            score += 0.3
+        elif maturity_code == 4 and complexity_codes[i] == 3:
+            score += 0.2
+        score += budget_bonus[cost_codes[i]]
+        if high_emitter and impact_codes[i] == 3:
+            score += 0.2
+        if 1 <= maturity_code <= 2 and time_codes[i] == 1:
+            score += 0.2
+        scores[i] = min(score, 1.0)
+        
+        fit = 0.5
+        if industry_match[i]:
+            fit += 0.2
+        if size_match[i]:
+            fit += 0.15
+        init_cost = cost_codes[i] if cost_codes[i] != 0 else 2
+        if budget_code >= init_cost:
+            fit += 0.1
+        else:
+            fit -= 0.15
+        confidence[i] = fit
+    
+    return scores, confidence
+
+
+if NUMBA_AVAILABLE:
+    _score_rules_and_confidence = njit(cache=True)(_score_rules_and_confidence)
+
+
+def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first, with ties kept in index order"""
+    k = max(0, min(k, scores.size))
+    
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    if k < scores.size:
+        # O(N) selection of the k-th best score instead of a full sort
+        threshold = np.partition(scores, scores.size - k)[scores.size - k]
+        above = np.flatnonzero(scores > threshold)
+        tied = np.flatnonzero(scores == threshold)[:k - above.size]
+        top = np.concatenate((above, tied))
+    else:
+        top = np.arange(scores.size)
+    
+    return top[np.argsort(-scores[top], kind='stable')]
+
+# Bonus indexed by [company budget code, initiative cost code]; row/column 0
+# is an unrecognised value
+_BUDGET_MATCH = np.array([
+    # Unknown, Low, Medium, High initiative cost
+    [0.0, 0.0, 0.0, 0.0],    # Unknown budget
+    [0.0, 0.3, 0.0, 0.0],    # Low budget
+    [0.0, 0.0, 0.2, 0.0],    # Medium budget
+    [0.0, 0.2, 0.15, 0.1]    # High budget
+])
+
 class SustainabilityRecommendationEngine:
     """AI-powered recommendation engine for sustainability initiatives"""
     
@@ -16,7 +187,8 @@ class SustainabilityRecommendationEngine:
         self.company_profiles = {}
         self.initiative_embeddings = {}
         self.similarity_matrix = None
-        self.clusters = {}
+        self.feature_scaler = None
+        self.initiative_unit_vectors = None
         self.is_trained = False
         
     def create_company_profile(self, company_data: Dict) -> Dict:
@@ -46,83 +218,67 @@ class SustainabilityRecommendationEngine:
     
     def _assess_maturity(self, company_data: Dict) -> str:
         """Assess company's sustainability maturity level"""
-        try:
-            score = 0
-            
-            # Existing initiatives
-            initiatives = company_data.get('current_initiatives', [])
-            score += min(len(initiatives) * 10, 40)
-            
-            # Emission tracking
-            if company_data.get('has_emission_tracking', False):
-                score += 20
-            
-            # Targets set
-            targets = company_data.get('reduction_targets', {})
-            if targets:
-                score += 20
-            
-            # Reporting
-            if company_data.get('sustainability_reporting', False):
-                score += 20
-            
-            # Classify maturity
-            if score >= 80:
-                return 'Advanced'
-            elif score >= 50:
-                return 'Intermediate'
-            elif score >= 20:
-                return 'Beginner'
-            else:
-                return 'Starter'
-                
-        except Exception as e:
-            logger.error(f"Error assessing maturity: {e}")
-            return 'Unknown'
+        score = 0
+        
+        # Existing initiatives
+        initiatives = company_data.get('current_initiatives', [])
+        score += min(len(initiatives) * 10, 40)
+        
+        # Emission tracking
+        if company_data.get('has_emission_tracking', False):
+            score += 20
+        
+        # Targets set
+        targets = company_data.get('reduction_targets', {})
+        if targets:
+            score += 20
+        
+        # Reporting
+        if company_data.get('sustainability_reporting', False):
+            score += 20
+        
+        # Classify maturity
+        if score >= 80:
+            return 'Advanced'
+        elif score >= 50:
+            return 'Intermediate'
+        elif score >= 20:
+            return 'Beginner'
+        else:
+            return 'Starter'
     
     def _extract_company_features(self, profile: Dict) -> np.ndarray:
-        """Extract numerical features from company profile"""
-        try:
-            features = []
-            
-            # Industry encoding (simplified)
-            industry_encoding = {
-                'Technology': 1, 'Manufacturing': 2, 'Energy': 3,
-                'Transportation': 4, 'Construction': 5, 'Other': 0
-            }
-            features.append(industry_encoding.get(profile['industry_sector'], 0))
-            
-            # Size encoding
-            size_encoding = {'Small': 1, 'Medium': 2, 'Large': 3}
-            features.append(size_encoding.get(profile['company_size'], 2))
-            
-            # Emissions (log scale)
-            features.append(np.log1p(profile['annual_emissions']))
-            
-            # Budget encoding
-            budget_encoding = {'Low': 1, 'Medium': 2, 'High': 3}
-            features.append(budget_encoding.get(profile['budget_range'], 2))
-            
-            # Maturity encoding
-            maturity_encoding = {'Starter': 1, 'Beginner': 2, 'Intermediate': 3, 'Advanced': 4}
-            features.append(maturity_encoding.get(profile['sustainability_maturity'], 1))
-            
-            # Number of current initiatives
-            features.append(len(profile['current_initiatives']))
-            
-            # Scope breakdown (if available)
-            breakdown = profile.get('emission_breakdown', {})
-            features.extend([
-                breakdown.get('scope1', 0),
-                breakdown.get('scope2', 0),
-                breakdown.get('scope3', 0)
-            ])
-            
-            return np.array(features)
-            
-        except Exception as e:
-            logger.error(f"Error extracting features: {e}")
-            return np.zeros(9)
+        """Extract numerical features from company profile
+        
+        Features follow the layout of _extract_initiative_features and describe
+        the initiative best suited to the company.
+        """
+        features = np.empty(_INITIATIVE_FEATURE_COUNT, dtype=np.float32)
+        annual_emissions = profile['annual_emissions'] or 0.0
+        pace = _MATURITY_PACE.get(profile['sustainability_maturity'], 1)
+        
+        # Category addressing the largest scope, if a breakdown is available
+        breakdown = profile.get('emission_breakdown') or {}
+        scope = max(_SCOPE_CATEGORIES, key=lambda key: breakdown.get(key, 0))
+        category = _SCOPE_CATEGORIES[scope] if breakdown.get(scope, 0) > 0 else 'Other'
+        features[0] = _CATEGORY_CODES[category]
+        
+        features[1] = _LEVEL_CODES.get(profile['budget_range'], 2)
+        features[2] = pace
+        
+        # Emissions (log scale), matched against reduction potential
+        features[3] = math.log1p(annual_emissions)
+        
+        features[4] = pace
+        features[5] = _RISK_ROI_TIMEFRAME.get(profile['risk_tolerance'], 2)
+        features[6] = _LEVEL_CODES['High' if annual_emissions > _HIGH_EMITTER_THRESHOLD else 'Medium']
+        
+        # The company's own industry among the top industries
+        industry = profile['industry_sector']
+        for offset, top_industry in enumerate(_TOP_INDUSTRIES, start=7):
+            features[offset] = industry == top_industry
+        
+        return features
     
     def load_initiative_database(self, initiatives: List[Dict]) -> Dict:
         """Load and process sustainability initiatives database"""
@@ -154,6 +310,7 @@ class SustainabilityRecommendationEngine:
                 processed_initiatives.append(processed_init)
             
             self.initiatives_db = processed_initiatives
+            self._build_initiative_columns()
             self._build_similarity_matrix()
             
             return {
@@ -168,50 +325,65 @@ class SustainabilityRecommendationEngine:
     
     def _extract_initiative_features(self, initiative: Dict) -> np.ndarray:
         """Extract numerical features from initiative"""
-        try:
-            features = []
-            
-            # Category encoding
-            category_encoding = {
-                'Energy Efficiency': 1, 'Renewable Energy': 2, 'Transportation': 3,
-                'Waste Management': 4, 'Water Conservation': 5, 'Green Building': 6,
-                'Supply Chain': 7, 'Other': 0
-            }
-            features.append(category_encoding.get(initiative['category'], 0))
-            
-            # Cost encoding
-            cost_encoding = {'Low': 1, 'Medium': 2, 'High': 3}
-            features.append(cost_encoding.get(initiative['cost_range'], 2))
-            
-            # Implementation time
-            time_encoding = {'Short': 1, 'Medium': 2, 'Long': 3}
-            features.append(time_encoding.get(initiative['implementation_time'], 2))
-            
-            # CO2 reduction potential (log scale)
-            features.append(np.log1p(initiative['co2_reduction_potential']))
-            
-            # Complexity
-            complexity_encoding = {'Low': 1, 'Medium': 2, 'High': 3}
-            features.append(complexity_encoding.get(initiative['complexity'], 2))
-            
-            # ROI timeframe
-            roi_encoding = {'Short': 1, 'Medium': 2, 'Long': 3}
-            features.append(roi_encoding.get(initiative['roi_timeframe'], 2))
-            
-            # Impact
-            impact_encoding = {'Low': 1, 'Medium': 2, 'High': 3}
-            features.append(impact_encoding.get(initiative['sustainability_impact'], 2))
-            
-            # Industry applicability (binary features for top industries)
-            top_industries = ['Technology', 'Manufacturing', 'Energy', 'Transportation']
-            for industry in top_industries:
-                features.append(1 if industry in initiative['industry_applicability'] else 0)
-            
-            return np.array(features)
-            
-        except Exception as e:
-            logger.error(f"Error extracting initiative features: {e}")
-            return np.zeros(11)
+        features = np.empty(_INITIATIVE_FEATURE_COUNT, dtype=np.float32)
+        
+        features[0] = _CATEGORY_CODES.get(initiative['category'], 0)
+        features[1] = _LEVEL_CODES.get(initiative['cost_range'], 2)
+        features[2] = _TIMEFRAME_CODES.get(initiative['implementation_time'], 2)
+        
+        # CO2 reduction potential (log scale)
+        features[3] = math.log1p(initiative['co2_reduction_potential'] or 0.0)
+        
+        features[4] = _LEVEL_CODES.get(initiative['complexity'], 2)
+        features[5] = _TIMEFRAME_CODES.get(initiative['roi_timeframe'], 2)
+        features[6] = _LEVEL_CODES.get(initiative['sustainability_impact'], 2)
+        
+        # Industry applicability (binary features for top industries)
+        applicability = initiative['industry_applicability']
+        for offset, industry in enumerate(_TOP_INDUSTRIES, start=7):
+            features[offset] = industry in applicability
+        
+        return features
+    
+    def _build_initiative_columns(self):
+        """Store per-initiative attributes as column arrays for vectorized scoring"""
+        initiatives = self.initiatives_db
+        
+        self.cost_codes = self._code_column(initiatives, 'cost_range', _LEVEL_CODES)
+        self.complexity_codes = self._code_column(initiatives, 'complexity', _LEVEL_CODES)
+        self.impact_codes = self._code_column(initiatives, 'sustainability_impact', _LEVEL_CODES)
+        self.time_codes = self._code_column(initiatives, 'implementation_time', _TIMEFRAME_CODES)
+        
+        # One boolean column per industry / company size named by any initiative
+        self.industry_fit = self._membership_columns(initiatives, 'industry_applicability')
+        self.size_fit = self._membership_columns(initiatives, 'company_size_fit')
+        self._no_match = np.zeros(len(initiatives), dtype=bool)
+        
+        self._prerequisite_sets = [frozenset(init['prerequisites']) for init in initiatives]
+        
+        # Initiative names may repeat, so map each name to all of its rows
+        self._name_to_indices = {}
+        for i, init in enumerate(initiatives):
+            self._name_to_indices.setdefault(init['name'], []).append(i)
+    
+    @staticmethod
+    def _code_column(initiatives: List[Dict], field: str, codes: Dict[str, int]) -> np.ndarray:
+        """Encode a categorical field as an int8 column, 0 for unrecognised values"""
+        return np.fromiter(
+            (codes.get(init[field], 0) for init in initiatives),
+            dtype=np.int8, count=len(initiatives)
+        )
+    
+    @staticmethod
+    def _membership_columns(initiatives: List[Dict], field: str) -> Dict[str, np.ndarray]:
+        """Map each value of a list field to a mask of the initiatives containing it"""
+        columns = {}
+        for i, init in enumerate(initiatives):
+            for value in init[field]:
+                if value not in columns:
+                    columns[value] = np.zeros(len(initiatives), dtype=bool)
+                columns[value][i] = True
+        return columns
     
     def _build_similarity_matrix(self):
         """Build similarity matrix for initiatives"""
@@ -220,16 +392,28 @@ class SustainabilityRecommendationEngine:
                 return
             
             # Extract all feature vectors
-            features = np.array([init['features'] for init in self.initiatives_db])
+            features = np.vstack([init['features'] for init in self.initiatives_db])
+            features = features.astype(np.float32, copy=False)
             
-            # Scale features
+            # Scale features (StandardScaler keeps float32 input as float32)
             scaler = StandardScaler()
             features_scaled = scaler.fit_transform(features)
             
-            # Calculate cosine similarity
-            self.similarity_matrix = cosine_similarity(features_scaled)
             self.feature_scaler = scaler
             
+            # Fitted scaling parameters, applied inline at query time
+            self._feature_mean = scaler.mean_.astype(np.float32)
+            self._feature_inv_scale = (1.0 / scaler.scale_).astype(np.float32)
+            
+            # Keep the L2-normalised catalog so a query is a single mat-vec product
+            norms = np.linalg.norm(features_scaled, axis=1, keepdims=True)
+            self.initiative_unit_vectors = np.ascontiguousarray(
+                features_scaled / np.where(norms == 0, 1, norms)
+            )
+            
+            # Cosine similarity of unit vectors is a plain Gram matrix
+            self.similarity_matrix = self.initiative_unit_vectors @ self.initiative_unit_vectors.T
+            
             logger.info(f"Built similarity matrix: {self.similarity_matrix.shape}")
             
         except Exception as e:
@@ -240,375 +424,357 @@ class SustainabilityRecommendationEngine:
         self,
         company_profile: Dict,
         num_recommendations: int = 10,
-        filter_existing: bool = True
+        filter_existing: bool = True,
+        generated_at: Optional[str] = None
     ) -> Dict:
-        """Generate personalized initiative recommendations"""
+        """Generate personalized initiative recommendations
+        
+        generated_at: ISO timestamp for the metadata, defaults to now
+        """
         try:
             if not self.initiatives_db:
                 raise ValueError("Initiative database not loaded")
             
-            company_features = company_profile['features']
-            existing_initiatives = set(company_profile.get('current_initiatives', []))
-            
-            recommendations = []
-            
             # Method 1: Content-based filtering
             content_scores = self._content_based_recommendations(company_profile)
             
-            # Method 2: Collaborative filtering (simplified)
-            collaborative_scores = self._collaborative_recommendations(company_profile)
-            
-            # Method 3: Rules-based recommendations
-            rules_scores = self._rules_based_recommendations(company_profile)
+            return self._rank_initiatives(
+                company_profile, content_scores, num_recommendations, filter_existing,
+                generated_at or datetime.now().isoformat()
+            )
             
-            # Combine scores
-            for i, initiative in enumerate(self.initiatives_db):
-                if filter_existing and initiative['name'] in existing_initiatives:
-                    continue
-                
-                # Weighted combination of methods
-                combined_score = (
-                    0.4 * content_scores.get(i, 0) +
-                    0.3 * collaborative_scores.get(i, 0) +
-                    0.3 * rules_scores.get(i, 0)
-                )
-                
-                # Calculate confidence and rationale
-                confidence = self._calculate_confidence(company_profile, initiative)
-                rationale = self._generate_rationale(company_profile, initiative)
-                
-                recommendation = {
-                    'initiative': initiative,
-                    'score': float(combined_score),
-                    'confidence': float(confidence),
-                    'rationale': rationale,
-                    'estimated_impact': self._estimate_impact(company_profile, initiative),
-                    'implementation_roadmap': self._generate_roadmap(initiative)
-                }
-                
-                recommendations.append(recommendation)
+        except Exception as e:
+            logger.error(f"Error generating recommendations: {e}")
+            raise
+    
+    def recommend_batch(
+        self,
+        company_profiles: List[Dict],
+        num_recommendations: int = 10,
+        filter_existing: bool = True
+    ) -> List[Dict]:
+        """Generate recommendations for several companies at once
+        
+        Content-based scores for all companies come from a single matrix
+        product; results match calling recommend_initiatives per profile.
+        All results share one generated_at timestamp.
+        """
+        try:
+            if not self.initiatives_db:
+                raise ValueError("Initiative database not loaded")
             
-            # Sort by score and return top recommendations
-            recommendations.sort(key=lambda x: x['score'], reverse=True)
-            top_recommendations = recommendations[:num_recommendations]
+            content_scores = self._content_based_batch(company_profiles)
+            generated_at = datetime.now().isoformat()
             
-            return {
-                'recommendations': top_recommendations,
-                'total_considered': len(recommendations),
-                'company_profile_summary': self._summarize_profile(company_profile),
-                'recommendation_metadata': {
-                    'generated_at': datetime.now().isoformat(),
-                    'methods_used': ['content_based', 'collaborative', 'rules_based'],
-                    'filters_applied': ['existing_initiatives'] if filter_existing else []
-                }
-            }
+            return [
+                self._rank_initiatives(
+                    profile, profile_scores, num_recommendations, filter_existing,
+                    generated_at
+                )
+                for profile, profile_scores in zip(company_profiles, content_scores)
+            ]
             
         except Exception as e:
-            logger.error(f"Error generating recommendations: {e}")
+            logger.error(f"Error generating batch recommendations: {e}")
             raise
     
-    def _content_based_recommendations(self, company_profile: Dict) -> Dict:
+    def _rank_initiatives(
+        self,
+        company_profile: Dict,
+        content_scores: np.ndarray,
+        num_recommendations: int,
+        filter_existing: bool,
+        generated_at: str
+    ) -> Dict:
+        """Combine scoring methods and build the top recommendations for one company"""
+        existing_initiatives = frozenset(company_profile.get('current_initiatives', []))
+        
+        # Method 2: Collaborative filtering (simplified)
+        collaborative_scores = self._collaborative_recommendations(company_profile)
+        
+        # Method 3: Rules-based recommendations
+        rules_scores, fit_confidence = self._rules_based_recommendations(company_profile)
+        
+        # Weighted combination of methods
+        combined_scores = (
+            0.4 * content_scores +
+            0.3 * collaborative_scores +
+            0.3 * rules_scores
+        )
+        
+        # Exclude initiatives the company already runs before ranking
+        num_considered = len(self.initiatives_db)
+        if filter_existing:
+            excluded = [
+                i for name in existing_initiatives
+                for i in self._name_to_indices.get(name, ())
+            ]
+            combined_scores[excluded] = -np.inf
+            num_considered -= len(excluded)
+        
+        # Select the top candidates, keeping catalog order for ties
+        top = _top_k_indices(combined_scores, min(num_recommendations, num_considered))
+        
+        # Only the returned initiatives need confidence, rationale and roadmap
+        top_recommendations = []
+        for i in top:
+            initiative = self.initiatives_db[i]
+            
+            # Calculate confidence and rationale
+            confidence = self._calculate_confidence(
+                existing_initiatives, self._prerequisite_sets[i], fit_confidence[i]
+            )
+            rationale = self._generate_rationale(company_profile, initiative)
+            
+            top_recommendations.append({
+                'initiative': initiative,
+                'score': float(combined_scores[i]),
+                'confidence': float(confidence),
+                'rationale': rationale,
+                'estimated_impact': self._estimate_impact(company_profile, initiative),
+                'implementation_roadmap': self._generate_roadmap(initiative)
+            })
+        
+        return {
+            'recommendations': top_recommendations,
+            'total_considered': num_considered,
+            'company_profile_summary': self._summarize_profile(company_profile),
+            'recommendation_metadata': {
+                'generated_at': generated_at,
+                'methods_used': _METHODS_USED,
+                'filters_applied': _EXISTING_FILTER if filter_existing else ()
+            }
+        }
+    
+    def _content_based_recommendations(self, company_profile: Dict) -> np.ndarray:
         """Content-based recommendation using feature similarity"""
         try:
-            scores = {}
             company_features = company_profile['features']
             
             if self.feature_scaler is None:
-                return scores
+                return np.zeros(len(self.initiatives_db))
             
-            # Scale company features
-            company_features_scaled = self.feature_scaler.transform(
-                company_features.reshape(1, -1)
-            )
+            # Scale and normalise company features
+            company_vector = (company_features - self._feature_mean) * self._feature_inv_scale
+            company_vector /= np.linalg.norm(company_vector) or 1
             
-            for i, initiative in enumerate(self.initiatives_db):
-                init_features_scaled = self.feature_scaler.transform(
-                    initiative['features'].reshape(1, -1)
-                )
-                
-                # Calculate similarity
-                similarity = cosine_similarity(
-                    company_features_scaled, init_features_scaled
-                )[0][0]
-                
-                scores[i] = similarity
-            
-            return scores
+            # Cosine similarity against the pre-normalised catalog
+            return self.initiative_unit_vectors @ company_vector
             
         except Exception as e:
             logger.error(f"Error in content-based recommendations: {e}")
-            return {}
+            return np.zeros(len(self.initiatives_db))
     
-    def _collaborative_recommendations(self, company_profile: Dict) -> Dict:
+    def _content_based_batch(self, company_profiles: List[Dict]) -> np.ndarray:
+        """Content-based scores for several companies, one row per company"""
+        try:
+            if self.feature_scaler is None or not company_profiles:
+                return np.zeros((len(company_profiles), len(self.initiatives_db)))
+            
+            company_vectors = np.vstack([profile['features'] for profile in company_profiles])
+            company_vectors = (company_vectors - self._feature_mean) * self._feature_inv_scale
+            norms = np.linalg.norm(company_vectors, axis=1, keepdims=True)
+            company_vectors /= np.where(norms == 0, 1, norms)
+            
+            return company_vectors @ self.initiative_unit_vectors.T
+            
+        except Exception as e:
+            logger.error(f"Error in batch content-based recommendations: {e}")
+            return np.zeros((len(company_profiles), len(self.initiatives_db)))
+    
+    def _collaborative_recommendations(self, company_profile: Dict) -> np.ndarray:
         """Simplified collaborative filtering"""
         try:
-            scores = {}
+            scores = np.full(len(self.initiatives_db), 0.5)  # Base score
             
             # Find similar companies (simplified - in practice, use user-item matrix)
             similar_industry = company_profile['industry_sector']
             similar_size = company_profile['company_size']
             
             # Boost scores for initiatives popular in similar companies
-            for i, initiative in enumerate(self.initiatives_db):
-                score = 0.5  # Base score
-                
-                # Industry match bonus
-                if similar_industry in initiative['industry_applicability']:
-                    score += 0.3
-                
-                # Size match bonus
-                if similar_size in initiative['company_size_fit']:
-                    score += 0.2
-                
-                scores[i] = score
+            industry_match = self.industry_fit.get(similar_industry)
+            if industry_match is not None:
+                scores += np.where(industry_match, 0.3, 0.0)
+            
+            size_match = self.size_fit.get(similar_size)
+            if size_match is not None:
+                scores += np.where(size_match, 0.2, 0.0)
             
             return scores
             
         except Exception as e:
             logger.error(f"Error in collaborative recommendations: {e}")
-            return {}
+            return np.zeros(len(self.initiatives_db))
     
-    def _rules_based_recommendations(self, company_profile: Dict) -> Dict:
-        """Rules-based recommendations using business logic"""
+    def _rules_based_recommendations(self, company_profile: Dict) -> Tuple[np.ndarray, np.ndarray]:
+        """Rules-based recommendations using business logic
+        
+        Also returns the profile-fit part of each initiative's confidence
+        (industry, size and budget), which reads the same columns.
+        """
         try:
-            scores = {}
-            
             annual_emissions = company_profile['annual_emissions']
             maturity = company_profile['sustainability_maturity']
             budget_range = company_profile['budget_range']
+            budget_code = _LEVEL_CODES.get(budget_range, 2)
             
-            for i, initiative in enumerate(self.initiatives_db):
-                score = 0.5  # Base score
-                
-                # Maturity matching
-                if maturity == 'Starter' and initiative['complexity'] == 'Low':
-                    score += 0.3
-                elif maturity == 'Advanced' and initiative['complexity'] == 'High':
-                    score += 0.2
-                
-                # Budget matching
-                budget_match = {
-                    ('Low', 'Low'): 0.3,
-                    ('Medium', 'Medium'): 0.2,
-                    ('High', 'High'): 0.1,
-                    ('High', 'Medium'): 0.15,
-                    ('High', 'Low'): 0.2
-                }
-                score += budget_match.get((budget_range, initiative['cost_range']), 0)
-                
-                # High impact bonus for high emitters
-                if annual_emissions > 10000 and initiative['sustainability_impact'] == 'High':
-                    score += 0.2
-                
-                # Quick wins for beginners
-                if (maturity in ['Starter', 'Beginner'] and 
-                    initiative['implementation_time'] == 'Short'):
-                    score += 0.2
-                
-                scores[i] = min(score, 1.0)  # Cap at 1.0
+            industry_match = self.industry_fit.get(company_profile['industry_sector'], self._no_match)
+            size_match = self.size_fit.get(company_profile['company_size'], self._no_match)
             
-            return scores
+            # Budget matching bonus indexed by initiative cost code
+            budget_bonus = _BUDGET_MATCH[_LEVEL_CODES.get(budget_range, 0)]
             
-        except Exception as e:
-            logger.error(f"Error in rules-based recommendations: {e}")
-            return {}
-    
-    def _calculate_confidence(self, company_profile: Dict, initiative: Dict) -> float:
-        """Calculate confidence score for recommendation"""
-        try:
-            confidence = 0.5  # Base confidence
+            if NUMBA_AVAILABLE and len(self.initiatives_db) >= _NUMBA_MIN_INITIATIVES:
+                return _score_rules_and_confidence(
+                    self.cost_codes, self.complexity_codes, self.impact_codes, self.time_codes,
+                    industry_match, size_match, budget_bonus, budget_code,
+                    _MATURITY_CODES.get(maturity, 0), annual_emissions > _HIGH_EMITTER_THRESHOLD
+                )
+            
+            scores = np.full(len(self.initiatives_db), 0.5)  # Base score
             
-            # Industry match
-            if company_profile['industry_sector'] in initiative['industry_applicability']:
-                confidence += 0.2
+            # Maturity matching
+            if maturity == 'Starter':
+                scores += np.where(self.complexity_codes == _LEVEL_CODES['Low'], 0.3, 0.0)
+            elif maturity == 'Advanced':
+                scores += np.where(self.complexity_codes == _LEVEL_CODES['High'], 0.2, 0.0)
             
-            # Size match
-            if company_profile['company_size'] in initiative['company_size_fit']:
-                confidence += 0.15
+            # Budget matching
+            scores += budget_bonus[self.cost_codes]
             
-            # Prerequisites check
-            current_initiatives = set(company_profile.get('current_initiatives', []))
-            prerequisites = set(initiative.get('prerequisites', []))
+            # High impact bonus for high emitters
+            if annual_emissions > _HIGH_EMITTER_THRESHOLD:
+                scores += np.where(self.impact_codes == _LEVEL_CODES['High'], 0.2, 0.0)
             
-            if prerequisites.issubset(current_initiatives):
-                confidence += 0.15
-            elif prerequisites and not prerequisites.intersection(current_initiatives):
-                confidence -= 0.2
+            # Quick wins for beginners
+            if maturity in ['Starter', 'Beginner']:
+                scores += np.where(self.time_codes == _TIMEFRAME_CODES['Short'], 0.2, 0.0)
             
-            # Budget feasibility
-            budget_map = {'Low': 1, 'Medium': 2, 'High': 3}
-            company_budget = budget_map.get(company_profile['budget_range'], 2)
-            init_cost = budget_map.get(initiative['cost_range'], 2)
+            scores = np.minimum(scores, 1.0)  # Cap at 1.0
             
-            if company_budget >= init_cost:
-                confidence += 0.1
-            else:
-                confidence -= 0.15
+            # Confidence from industry, size and budget fit
+            fit_confidence = 0.5 + np.where(industry_match, 0.2, 0.0)
+            fit_confidence += np.where(size_match, 0.15, 0.0)
+            init_cost = np.where(self.cost_codes == 0, 2, self.cost_codes)
+            fit_confidence += np.where(budget_code >= init_cost, 0.1, -0.15)
             
-            return max(0.0, min(1.0, confidence))
+            return scores, fit_confidence
             
         except Exception as e:
-            logger.error(f"Error calculating confidence: {e}")
-            return 0.5
+            logger.error(f"Error in rules-based recommendations: {e}")
+            return np.zeros(len(self.initiatives_db)), np.full(len(self.initiatives_db), 0.5)
+    
+    def _calculate_confidence(
+        self,
+        current_initiatives: frozenset,
+        prerequisites: frozenset,
+        fit_confidence: float
+    ) -> float:
+        """Calculate confidence score for recommendation
+        
+        fit_confidence: industry/size/budget confidence from the rules scorer
+        """
+        confidence = fit_confidence
+        
+        # Prerequisites check
+        if prerequisites <= current_initiatives:
+            confidence += 0.15
+        elif prerequisites and prerequisites.isdisjoint(current_initiatives):
+            confidence -= 0.2
+        
+        return max(0.0, min(1.0, confidence))
     
     def _generate_rationale(self, company_profile: Dict, initiative: Dict) -> List[str]:
         """Generate human-readable rationale for recommendation"""
-        try:
-            rationale = []
-            
-            # Industry match
-            if company_profile['industry_sector'] in initiative['industry_applicability']:
-                rationale.append(
-                    f"Well-suited for {company_profile['industry_sector']} companies"
-                )
-            
-            # Maturity match
-            maturity = company_profile['sustainability_maturity']
-            complexity = initiative['complexity']
-            
-            if maturity == 'Starter' and complexity == 'Low':
-                rationale.append("Perfect starting point for sustainability journey")
-            elif maturity == 'Advanced' and complexity == 'High':
-                rationale.append("Advanced initiative matching your sustainability maturity")
-            
-            # Impact potential
-            if initiative['co2_reduction_potential'] > 1000:
-                rationale.append("High carbon reduction potential")
-            
-            # Cost effectiveness
-            if (initiative['cost_range'] == 'Low' and 
-                initiative['sustainability_impact'] in ['Medium', 'High']):
-                rationale.append("Cost-effective solution with good impact")
-            
-            # Quick implementation
-            if initiative['implementation_time'] == 'Short':
-                rationale.append("Can be implemented quickly for immediate impact")
-            
-            # ROI
-            if initiative['roi_timeframe'] == 'Short':
-                rationale.append("Quick return on investment expected")
-            
-            return rationale[:3]  # Limit to top 3 reasons
-            
-        except Exception as e:
-            logger.error(f"Error generating rationale: {e}")
-            return ["Recommended based on company profile analysis"]
+        rationale = []
+        
+        # Industry match
+        if company_profile['industry_sector'] in initiative['industry_applicability']:
+            rationale.append(
+                f"Well-suited for {company_profile['industry_sector']} companies"
+            )
+        
+        # Maturity match
+        maturity = company_profile['sustainability_maturity']
+        complexity = initiative['complexity']
+        
+        if maturity == 'Starter' and complexity == 'Low':
+            rationale.append("Perfect starting point for sustainability journey")
+        elif maturity == 'Advanced' and complexity == 'High':
+            rationale.append("Advanced initiative matching your sustainability maturity")
+        
+        # Impact potential
+        if initiative['co2_reduction_potential'] > 1000:
+            rationale.append("High carbon reduction potential")
+        
+        # Cost effectiveness
+        if (initiative['cost_range'] == 'Low' and 
+            initiative['sustainability_impact'] in ['Medium', 'High']):
+            rationale.append("Cost-effective solution with good impact")
+        
+        # Quick implementation
+        if initiative['implementation_time'] == 'Short':
+            rationale.append("Can be implemented quickly for immediate impact")
+        
+        # ROI
+        if initiative['roi_timeframe'] == 'Short':
+            rationale.append("Quick return on investment expected")
+        
+        return rationale[:3]  # Limit to top 3 reasons
     
     def _estimate_impact(self, company_profile: Dict, initiative: Dict) -> Dict:
         """Estimate implementation impact for the company"""
-        try:
-            annual_emissions = company_profile['annual_emissions']
-            
-            # Base reduction from initiative specs
-            base_reduction = initiative['co2_reduction_potential']
-            
-            # Scale based on company size
-            size_multipliers = {'Small': 0.5, 'Medium': 1.0, 'Large': 2.0}
-            size_multiplier = size_multipliers.get(company_profile['company_size'], 1.0)
-            
-            estimated_reduction = base_reduction * size_multiplier
-            
-            # Calculate percentage of total emissions
-            reduction_percentage = (estimated_reduction / annual_emissions * 100) if annual_emissions > 0 else 0
-            
-            # Estimate costs (simplified)
-            cost_ranges = {
-                'Low': (10000, 50000),
-                'Medium': (50000, 200000),
-                'High': (200000, 1000000)
-            }
-            cost_range = cost_ranges.get(initiative['cost_range'], (50000, 200000))
-            estimated_cost = cost_range[0] * size_multiplier
-            
-            return {
-                'estimated_co2_reduction': float(estimated_reduction),
-                'reduction_percentage': float(reduction_percentage),
-                'estimated_cost': float(estimated_cost),
-                'cost_per_tonne_co2': float(estimated_cost / estimated_reduction) if estimated_reduction > 0 else 0,
-                'payback_period_years': self._estimate_payback(estimated_cost, estimated_reduction)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error estimating impact: {e}")
-            return {}
+        annual_emissions = company_profile['annual_emissions']
+        
+        # Base reduction from initiative specs
+        base_reduction = initiative['co2_reduction_potential']
+        
+        # Scale based on company size
+        size_multipliers = {'Small': 0.5, 'Medium': 1.0, 'Large': 2.0}
+        size_multiplier = size_multipliers.get(company_profile['company_size'], 1.0)
+        
+        estimated_reduction = base_reduction * size_multiplier
+        
+        # Calculate percentage of total emissions
+        reduction_percentage = (estimated_reduction / annual_emissions * 100) if annual_emissions > 0 else 0
+        
+        # Estimate costs (simplified)
+        cost_ranges = {
+            'Low': (10000, 50000),
+            'Medium': (50000, 200000),
+            'High': (200000, 1000000)
+        }
+        cost_range = cost_ranges.get(initiative['cost_range'], (50000, 200000))
+        estimated_cost = cost_range[0] * size_multiplier
+        
+        return {
+            'estimated_co2_reduction': float(estimated_reduction),
+            'reduction_percentage': float(reduction_percentage),
+            'estimated_cost': float(estimated_cost),
+            'cost_per_tonne_co2': float(estimated_cost / estimated_reduction) if estimated_reduction > 0 else 0,
+            'payback_period_years': self._estimate_payback(estimated_cost, estimated_reduction)
+        }
     
     def _estimate_payback(self, cost: float, co2_reduction: float) -> float:
         """Estimate payback period in years"""
-        try:
-            # Assume $50 per tonne CO2 cost savings (simplified)
-            carbon_price = 50
-            annual_savings = co2_reduction * carbon_price
-            
-            if annual_savings > 0:
-                return cost / annual_savings
-            else:
-                return float('inf')
-                
-        except Exception as e:
+        # Assume $50 per tonne CO2 cost savings (simplified)
+        carbon_price = 50
+        annual_savings = co2_reduction * carbon_price
+        
+        if annual_savings > 0:
+            return cost / annual_savings
+        else:
             return float('inf')
     
     def _generate_roadmap(self, initiative: Dict) -> Dict:
-        """Generate implementation roadmap"""
-        try:
-            phases = []
-            
-            # Phase 1: Planning
-            phases.append({
-                'phase': 'Planning & Assessment',
-                'duration': '2-4 weeks',
-                'activities': [
-                    'Conduct detailed feasibility study',
-                    'Stakeholder alignment',
-                    'Budget approval',
-                    'Resource allocation'
-                ]
-            })
-            
-            # Phase 2: Implementation
-            impl_time = initiative['implementation_time']
-            impl_duration = {
-                'Short': '1-3 months',
-                'Medium': '3-9 months',
-                'Long': '9-18 months'
-            }.get(impl_time, '3-6 months')
-            
-            phases.append({
-                'phase': 'Implementation',
-                'duration': impl_duration,
-                'activities': [
-                    'Project kickoff',
-                    'System deployment/changes',
-                    'Staff training',
-                    'Initial testing'
-                ]
-            })
-            
-            # Phase 3: Monitoring
-            phases.append({
-                'phase': 'Monitoring & Optimization',
-                'duration': 'Ongoing',
-                'activities': [
-                    'Performance tracking',
-                    'Regular reporting',
-                    'Continuous improvement',
-                    'Impact measurement'
-                ]
-            })
-            
-            return {
-                'phases': phases,
-                'total_timeline': impl_duration,
-                'key_milestones': [
-                    'Feasibility study complete',
-                    'Implementation 50% complete',
-                    'Full deployment',
-                    'First impact measurement'
-                ]
-            }
-            
-        except Exception as e:
-            logger.error(f"Error generating roadmap: {e}")
-            return {}
+        """Generate implementation roadmap
+        
+        Roadmaps only depend on implementation time, so each recommendation
+        gets its own copy of the prebuilt template.
+        """
+        return copy.deepcopy(
+            _ROADMAP_TEMPLATES.get(initiative['implementation_time'], _DEFAULT_ROADMAP)
+        )
     
     def _summarize_profile(self, company_profile: Dict) -> Dict:
         """Summarize company profile for recommendations"""
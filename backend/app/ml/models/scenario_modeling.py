@@ -2,18 +2,123 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
 import logging
-from copy import deepcopy
+
+try:
+    from numba import njit, prange, types
+    NUMBA_AVAILABLE = True
+except ImportError:
+    prange = range
+    NUMBA_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+if NUMBA_AVAILABLE:
+    # Explicit kernel signatures: compiled (or loaded from the on-disk cache)
+    # at import rather than on the first scenario request. The baseline may
+    # be a read-only view of the cached baseline trajectory.
+    _VECTOR = types.float64[::1]
+    _BASELINE_TYPES = (_VECTOR, types.Array(types.float64, 1, 'C', readonly=True))
+    _PARAMETER_TYPES = (_VECTOR,) * 6
+
+
+def _intervention_impacts(
+    baseline_emissions, starts, durations, decays,
+    annual_reductions, one_time_reductions, costs, noise
+):
+    """Yearly emission reduction and cost of every intervention
+    
+    starts are year offsets from the first projection year; noise holds the
+    pre-drawn uncertainty multipliers, one row per intervention.
+    """
+    n_interventions = starts.shape[0]
+    n_years = baseline_emissions.shape[0]
+    impacts = np.zeros((n_interventions, n_years))
+    spend = np.zeros((n_interventions, n_years))
+    
+    for i in range(n_interventions):
+        for year in range(n_years):
+            if year < starts[i]:
+                continue
+            
+            years_since_start = year - starts[i]
+            if years_since_start < durations[i]:
+                # During implementation - gradual ramp up
+                effectiveness = (years_since_start + 1) / durations[i]
+            else:
+                # Post implementation - full effect with decay
+                effectiveness = (1 - decays[i]) ** (years_since_start - durations[i])
+            
+            effectiveness = max(0.0, min(1.0, effectiveness * noise[i, year]))
+            reduction = baseline_emissions[year] * (annual_reductions[i] * effectiveness)
+            
+            # One-time reduction and cost land in the first year
+            if years_since_start == 0:
+                reduction += one_time_reductions[i]
+                spend[i, year] = costs[i]
+            
+            impacts[i, year] = reduction
+    
+    return impacts, spend
+
+
+if NUMBA_AVAILABLE:
+    _intervention_impacts = njit(
+        [
+            (baseline,) + _PARAMETER_TYPES + (noise,)
+            for baseline in _BASELINE_TYPES
+            for noise in (types.float64[:, ::1], types.float32[:, ::1])
+        ],
+        cache=True
+    )(_intervention_impacts)
+
+
+def _simulate_emissions(
+    baseline_emissions, starts, durations, decays,
+    annual_reductions, one_time_reductions, costs, noise
+):
+    """Emission trajectory for every Monte Carlo draw
+    
+    noise is (draws, interventions, years); draws run in parallel when compiled.
+    Draws and trajectories are float32 since they dominate memory traffic.
+    """
+    n_draws = noise.shape[0]
+    emissions = np.empty((n_draws, baseline_emissions.shape[0]), dtype=np.float32)
+    
+    for draw in prange(n_draws):
+        impacts, _ = _intervention_impacts(
+            baseline_emissions, starts, durations, decays,
+            annual_reductions, one_time_reductions, costs, noise[draw]
+        )
+        emissions[draw] = baseline_emissions - impacts.sum(axis=0)
+    
+    return emissions
+
+
+if NUMBA_AVAILABLE:
+    _simulate_emissions = njit(
+        [
+            (baseline,) + _PARAMETER_TYPES + (types.float32[:, :, ::1],)
+            for baseline in _BASELINE_TYPES
+        ],
+        parallel=True,
+        cache=True
+    )(_simulate_emissions)
+
+
 class CarbonScenarioModeler:
     """Model different carbon reduction scenarios and their impacts"""
     
-    def __init__(self):
+    def __init__(self, random_state: Optional[int] = None):
         self.baseline_scenario = None
         self.scenarios = {}
         self.comparison_results = {}
+        self._baseline_emissions = None
+        self._baseline_intensity = None
+        self._baseline_metrics = None
+        self._scenario_metrics = {}
+        self._rng = np.random.default_rng(random_state)
         
     def create_baseline_scenario(self, company_data: Dict) -> Dict:
         """Create baseline scenario (business as usual)"""
@@ -37,6 +142,13 @@ class CarbonScenarioModeler:
             baseline['projections'] = self._project_emissions(baseline)
             
             self.baseline_scenario = baseline
+            
+            # Cache the trajectory for intervention projections; read-only
+            # because scenarios share slices of it
+            self._baseline_emissions, _, self._baseline_intensity = (
+                self._scenario_baseline_arrays(baseline)
+            )
+            self._baseline_metrics = self._comparison_metrics('baseline', baseline)
             return baseline
             
         except Exception as e:
@@ -58,7 +170,7 @@ class CarbonScenarioModeler:
                 'name': name,
                 'type': 'intervention',
                 'description': description,
-                'parameters': deepcopy(self.baseline_scenario['parameters']),
+                'parameters': self.baseline_scenario['parameters'].copy(),
                 'timeline_years': self.baseline_scenario['timeline_years'],
                 'interventions': interventions,
                 'created_at': datetime.now().isoformat()
@@ -75,6 +187,7 @@ class CarbonScenarioModeler:
             scenario['impact_metrics'] = self._calculate_scenario_impact(scenario)
             
             self.scenarios[name] = scenario
+            self._scenario_metrics[name] = self._comparison_metrics(name, scenario)
             return scenario
             
         except Exception as e:
@@ -111,7 +224,8 @@ class CarbonScenarioModeler:
             if not self.baseline_scenario:
                 raise ValueError("Baseline scenario must be created first")
             
-            current_year = datetime.now().year
+            now = datetime.now()
+            current_year = now.year
             years_to_target = target_year - current_year
             
             if years_to_target <= 0:
@@ -126,14 +240,14 @@ class CarbonScenarioModeler:
                 'name': f'{target_reduction*100:.0f}% Reduction by {target_year}',
                 'type': 'target',
                 'description': f'Scenario to achieve {target_reduction*100:.0f}% emission reduction by {target_year}',
-                'parameters': deepcopy(self.baseline_scenario['parameters']),
+                'parameters': self.baseline_scenario['parameters'].copy(),
                 'timeline_years': years_to_target,
                 'target_reduction': target_reduction,
                 'target_year': target_year,
                 'target_emissions': target_emissions,
                 'required_annual_rate': required_rate,
                 'optimization_strategy': optimization_strategy,
-                'created_at': datetime.now().isoformat()
+                'created_at': now.isoformat()
             }
             
             # Generate intervention recommendations
@@ -148,61 +262,80 @@ class CarbonScenarioModeler:
             scenario['feasibility_analysis'] = self._analyze_target_feasibility(scenario)
             
             self.scenarios[scenario['name']] = scenario
+            self._scenario_metrics[scenario['name']] = self._comparison_metrics(
+                scenario['name'], scenario
+            )
             return scenario
             
         except Exception as e:
             logger.error(f"Error creating target scenario: {e}")
             raise
     
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _baseline_arrays(
+        current_emissions: float,
+        growth_rate: float,
+        efficiency_rate: float,
+        timeline_years: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Baseline emissions, cumulative emissions and intensity per year
+        
+        Memoised on the projection inputs, so the arrays are read-only.
+        """
+        # Net growth rate (business growth - efficiency improvements)
+        net_growth_rate = growth_rate - efficiency_rate
+        
+        # Year 0 is current emissions; business growth is already applied in year 0.
+        # float64 throughout, since the compiled kernels only accept float64 baselines
+        years = np.arange(timeline_years + 1, dtype=np.float64)
+        emissions = current_emissions * np.power(1 + net_growth_rate, years)
+        cumulative = np.cumsum(emissions)
+        intensity = emissions / np.power(1 + growth_rate, years + 1)
+        
+        for array in (emissions, cumulative, intensity):
+            array.flags.writeable = False
+        
+        return emissions, cumulative, intensity
+    
+    def _scenario_baseline_arrays(self, scenario: Dict) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Memoised baseline arrays for a scenario's parameters and timeline"""
+        params = scenario['parameters']
+        # Cast before the cached call: 0 and 0.0 share a cache key, so integer
+        # inputs must not produce arrays of a different dtype
+        return self._baseline_arrays(
+            float(params['current_emissions']),
+            float(params.get('business_growth_rate', 0.05)),
+            float(params.get('efficiency_improvement', 0.01)),
+            int(scenario['timeline_years'])
+        )
+    
     def _project_emissions(self, scenario: Dict) -> Dict:
         """Project emissions for baseline scenario"""
         try:
-            params = scenario['parameters']
-            timeline_years = scenario['timeline_years']
-            
-            current_emissions = params['current_emissions']
-            growth_rate = params.get('business_growth_rate', 0.05)
-            efficiency_rate = params.get('efficiency_improvement', 0.01)
-            
-            # Net growth rate (business growth - efficiency improvements)
-            net_growth_rate = growth_rate - efficiency_rate
+            emissions, cumulative, intensity = self._scenario_baseline_arrays(scenario)
             
+            start_year = datetime.now().year
             projections = {
-                'years': list(range(datetime.now().year, datetime.now().year + timeline_years + 1)),
-                'emissions': [],
-                'cumulative_emissions': [],
-                'emission_intensity': []
+                'years': list(range(start_year, start_year + len(emissions))),
+                'emissions': emissions.tolist(),
+                'cumulative_emissions': cumulative.tolist(),
+                'emission_intensity': intensity.tolist()
             }
             
-            cumulative = 0
-            business_growth = 1.0
-            
-            for year in range(timeline_years + 1):
-                if year == 0:
-                    annual_emissions = current_emissions
-                else:
-                    # Apply net growth rate
-                    annual_emissions = current_emissions * ((1 + net_growth_rate) ** year)
-                
-                business_growth *= (1 + growth_rate)
-                emission_intensity = annual_emissions / business_growth
-                cumulative += annual_emissions
-                
-                projections['emissions'].append(float(annual_emissions))
-                projections['cumulative_emissions'].append(float(cumulative))
-                projections['emission_intensity'].append(float(emission_intensity))
-            
             # Calculate summary statistics
+            first_emissions = float(emissions[0])
+            final_emissions = float(emissions[-1])
+            peak_year = int(emissions.argmax())
             projections['summary'] = {
-                'total_cumulative': float(cumulative),
-                'final_year_emissions': float(projections['emissions'][-1]),
-                'average_annual_emissions': float(np.mean(projections['emissions'])),
+                'total_cumulative': float(cumulative[-1]),
+                'final_year_emissions': final_emissions,
+                'average_annual_emissions': float(emissions.mean()),
                 'emission_change_total': float(
-                    (projections['emissions'][-1] - projections['emissions'][0]) / 
-                    projections['emissions'][0] * 100
+                    (final_emissions - first_emissions) / first_emissions * 100
                 ),
-                'peak_year': int(np.argmax(projections['emissions'])),
-                'peak_emissions': float(max(projections['emissions']))
+                'peak_year': peak_year,
+                'peak_emissions': float(emissions[peak_year])
             }
             
             return projections
@@ -215,12 +348,13 @@ class CarbonScenarioModeler:
         """Validate and standardize intervention definitions"""
         try:
             validated = []
+            default_start_year = datetime.now().year + 1
             
             for intervention in interventions:
                 validated_intervention = {
                     'name': intervention.get('name', 'Unnamed Intervention'),
                     'type': intervention.get('type', 'efficiency'),
-                    'start_year': intervention.get('start_year', datetime.now().year + 1),
+                    'start_year': intervention.get('start_year', default_start_year),
                     'implementation_duration': intervention.get('implementation_duration', 1),
                     'annual_reduction': intervention.get('annual_reduction', 0),
                     'one_time_reduction': intervention.get('one_time_reduction', 0),  # ← Ensure this exists
@@ -232,118 +366,237 @@ class CarbonScenarioModeler:
                     'uncertainty': intervention.get('uncertainty', 0.1)
                 }
                 
-                # Validate ranges
-                validated_intervention['annual_reduction'] = max(0, min(1, validated_intervention['annual_reduction']))
-                validated_intervention['one_time_reduction'] = max(0, validated_intervention['one_time_reduction'])
-                validated_intervention['uncertainty'] = max(0, min(1, validated_intervention['uncertainty']))
-                
                 validated.append(validated_intervention)
             
+            if not validated:
+                return validated
+            
+            # Validate ranges for all interventions at once
+            ranges = np.array(
+                [
+                    [v['annual_reduction'], v['one_time_reduction'], v['uncertainty']]
+                    for v in validated
+                ],
+                dtype=np.float64
+            )
+            annual_reductions = np.clip(ranges[:, 0], 0, 1).tolist()
+            one_time_reductions = np.maximum(ranges[:, 1], 0).tolist()
+            uncertainties = np.clip(ranges[:, 2], 0, 1).tolist()
+            
+            for i, validated_intervention in enumerate(validated):
+                validated_intervention['annual_reduction'] = annual_reductions[i]
+                validated_intervention['one_time_reduction'] = one_time_reductions[i]
+                validated_intervention['uncertainty'] = uncertainties[i]
+            
             return validated
             
         except Exception as e:
             logger.error(f"Error validating interventions: {e}")
             return interventions
     
+    def _baseline_series(self, scenario: Dict) -> Tuple[np.ndarray, np.ndarray]:
+        """Baseline emissions and intensity arrays over a scenario's timeline
+        
+        Slices the arrays cached by create_baseline_scenario when the scenario
+        shares the baseline parameters and fits within its timeline, otherwise
+        uses the memoised projection for its own timeline.
+        """
+        num_years = scenario['timeline_years'] + 1
+        if (
+            self._baseline_emissions is not None
+            and scenario['parameters'] == self.baseline_scenario['parameters']
+            and 0 < num_years <= len(self._baseline_emissions)
+        ):
+            return self._baseline_emissions[:num_years], self._baseline_intensity[:num_years]
+        
+        emissions, _, intensity = self._scenario_baseline_arrays(scenario)
+        return emissions, intensity
+    
+    @staticmethod
+    def _intervention_columns(interventions: List[Dict], start_year: int) -> Tuple[np.ndarray, ...]:
+        """Per-intervention parameters as float64 columns for the impact kernels
+        
+        Returns starts (as offsets from start_year), durations, decays, annual and
+        one-time reductions, costs and uncertainties.
+        """
+        starts = np.array(
+            [intervention['start_year'] - start_year for intervention in interventions],
+            dtype=np.float64
+        )
+        durations = np.array(
+            [intervention['implementation_duration'] for intervention in interventions],
+            dtype=np.float64
+        )
+        decays = np.array(
+            [intervention.get('effectiveness_decay', 0) for intervention in interventions],
+            dtype=np.float64
+        )
+        annual_reductions = np.array(
+            [intervention['annual_reduction'] for intervention in interventions],
+            dtype=np.float64
+        )
+        one_time_reductions = np.array(
+            [intervention.get('one_time_reduction', 0) for intervention in interventions],
+            dtype=np.float64
+        )
+        costs = np.array(
+            [intervention.get('cost', 0) for intervention in interventions],
+            dtype=np.float64
+        )
+        uncertainties = np.array(
+            [intervention.get('uncertainty', 0.1) for intervention in interventions],
+            dtype=np.float64
+        )
+        
+        return (
+            starts, durations, decays, annual_reductions,
+            one_time_reductions, costs, uncertainties
+        )
+    
     def _project_emissions_with_interventions(self, scenario: Dict) -> Dict:
         """Project emissions including intervention effects"""
         try:
             # Start with baseline projection
-            baseline_projections = self._project_emissions(scenario)
-            projections = deepcopy(baseline_projections)
+            baseline_emissions, baseline_intensity = self._baseline_series(scenario)
             
             interventions = scenario['interventions']
             timeline_years = scenario['timeline_years']
             start_year = datetime.now().year
             
-            # Track intervention effects
-            intervention_effects = []
+            (starts, durations, decays, annual_reductions,
+             one_time_reductions, costs, uncertainties) = self._intervention_columns(
+                interventions, start_year
+            )
             
-            for intervention in interventions:
-                effect = {
+            # Draw every uncertainty multiplier up front
+            noise = self._rng.normal(
+                1.0, uncertainties[:, None], size=(len(interventions), timeline_years + 1)
+            )
+            
+            impacts, spend = _intervention_impacts(
+                baseline_emissions, starts, durations, decays,
+                annual_reductions, one_time_reductions, costs, noise
+            )
+            cumulative_impacts = np.cumsum(impacts, axis=1)
+            
+            # Per-intervention rows are only materialised as lists for the output
+            intervention_effects = [
+                {
                     'name': intervention['name'],
-                    'annual_impact': [0] * (timeline_years + 1),
-                    'cumulative_impact': [0] * (timeline_years + 1),
-                    'costs': [0] * (timeline_years + 1)
+                    'annual_impact': impacts[i].tolist(),
+                    'cumulative_impact': cumulative_impacts[i].tolist(),
+                    'costs': spend[i].tolist()
                 }
-                
-                intervention_start = intervention['start_year'] - start_year
-                implementation_duration = intervention['implementation_duration']
-                
-                for year in range(timeline_years + 1):
-                    if year >= intervention_start:
-                        # Calculate intervention effect
-                        years_since_start = year - intervention_start
-                        
-                        if years_since_start < implementation_duration:
-                            # During implementation - gradual ramp up
-                            effectiveness = (years_since_start + 1) / implementation_duration
-                        else:
-                            # Post implementation - full effect with decay
-                            years_post_impl = years_since_start - implementation_duration
-                            decay_rate = intervention.get('effectiveness_decay', 0)
-                            effectiveness = (1 - decay_rate) ** years_post_impl
-                        
-                        # Apply uncertainty
-                        uncertainty = intervention.get('uncertainty', 0.1)
-                        effectiveness *= np.random.normal(1.0, uncertainty)
-                        effectiveness = max(0, min(1, effectiveness))
-                        
-                        # Calculate emission reduction
-                        baseline_emission = baseline_projections['emissions'][year]
-                        annual_reduction = intervention['annual_reduction'] * effectiveness
-                        absolute_reduction = baseline_emission * annual_reduction
-                        
-                        # Add one-time reduction in first year
-                        if years_since_start == 0:
-                            absolute_reduction += intervention['one_time_reduction']
-                        
-                        effect['annual_impact'][year] = absolute_reduction
-                        effect['cumulative_impact'][year] = (
-                            effect['cumulative_impact'][year-1] + absolute_reduction if year > 0 
-                            else absolute_reduction
-                        )
-                        
-                        # Calculate costs
-                        if years_since_start == 0:
-                            effect['costs'][year] = intervention['cost']
-                        
-                        # Subtract from baseline emissions
-                        projections['emissions'][year] -= absolute_reduction
-                
-                intervention_effects.append(effect)
+                for i, intervention in enumerate(interventions)
+            ]
             
-            # Recalculate cumulative emissions
-            cumulative = 0
-            for i, annual in enumerate(projections['emissions']):
-                cumulative += annual
-                projections['cumulative_emissions'][i] = cumulative
+            # Subtract intervention effects from baseline emissions
+            emissions = baseline_emissions - impacts.sum(axis=0)
+            cumulative_emissions = np.cumsum(emissions)
+            cumulative = cumulative_emissions[-1]
+            
+            projections = {
+                'years': list(range(start_year, start_year + timeline_years + 1)),
+                'emissions': emissions.tolist(),
+                'cumulative_emissions': cumulative_emissions.tolist(),
+                'emission_intensity': baseline_intensity.tolist()
+            }
             
             # Update summary
+            first_emissions = float(emissions[0])
+            final_emissions = float(emissions[-1])
             projections['summary'] = {
                 'total_cumulative': float(cumulative),
-                'final_year_emissions': float(projections['emissions'][-1]),
-                'average_annual_emissions': float(np.mean(projections['emissions'])),
+                'final_year_emissions': final_emissions,
+                'average_annual_emissions': float(emissions.mean()),
                 'emission_change_total': float(
-                    (projections['emissions'][-1] - projections['emissions'][0]) / 
-                    projections['emissions'][0] * 100
+                    (final_emissions - first_emissions) / first_emissions * 100
                 ),
-                'total_intervention_cost': float(sum(
-                    sum(effect['costs']) for effect in intervention_effects
-                )),
-                'total_reduction_achieved': float(sum(
-                    effect['cumulative_impact'][-1] for effect in intervention_effects
-                ))
+                'total_intervention_cost': float(spend.sum()),
+                'total_reduction_achieved': float(cumulative_impacts[:, -1].sum())
             }
             
             projections['intervention_effects'] = intervention_effects
             
+            # Yearly totals across interventions, reduced straight from the matrices
+            projections['effect_totals'] = {
+                'annual_impact': impacts.sum(axis=0).tolist(),
+                'costs': spend.sum(axis=0).tolist()
+            }
+            
             return projections
             
         except Exception as e:
             logger.error(f"Error projecting emissions with interventions: {e}")
             raise
     
+    def simulate_scenarios(
+        self,
+        interventions_batch: List[List[Dict]],
+        n_simulations: int = 1000
+    ) -> List[Dict]:
+        """Monte Carlo emission bands for several intervention sets
+        
+        Each set is validated like create_intervention_scenario and projected
+        n_simulations times over the baseline timeline, redrawing intervention
+        uncertainty each time. Returns P5/P50/P95 emissions per year.
+        """
+        try:
+            if not self.baseline_scenario:
+                raise ValueError("Baseline scenario must be created first")
+            if n_simulations < 1:
+                raise ValueError("n_simulations must be at least 1")
+            
+            timeline_years = self.baseline_scenario['timeline_years']
+            start_year = datetime.now().year
+            years = list(range(start_year, start_year + timeline_years + 1))
+            
+            results = []
+            for interventions in interventions_batch:
+                validated = self._validate_interventions(interventions)
+                (starts, durations, decays, annual_reductions,
+                 one_time_reductions, costs, uncertainties) = self._intervention_columns(
+                    validated, start_year
+                )
+                
+                # Float32 draws halve the size of the largest buffer
+                noise = self._rng.standard_normal(
+                    (n_simulations, len(validated), timeline_years + 1), dtype=np.float32
+                )
+                noise *= uncertainties.astype(np.float32)[None, :, None]
+                noise += 1.0
+                emissions = _simulate_emissions(
+                    self._baseline_emissions, starts, durations, decays,
+                    annual_reductions, one_time_reductions, costs, noise
+                )
+                
+                bands = np.quantile(emissions, [0.05, 0.5, 0.95], axis=0)
+                totals = np.quantile(
+                    emissions.sum(axis=1, dtype=np.float64), [0.05, 0.5, 0.95]
+                )
+                
+                results.append({
+                    'interventions': validated,
+                    'years': years,
+                    'n_simulations': n_simulations,
+                    'emission_bands': {
+                        'p5': bands[0].tolist(),
+                        'p50': bands[1].tolist(),
+                        'p95': bands[2].tolist()
+                    },
+                    'total_cumulative': {
+                        'p5': float(totals[0]),
+                        'p50': float(totals[1]),
+                        'p95': float(totals[2])
+                    }
+                })
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error simulating scenarios: {e}")
+            raise
+    
     def _calculate_scenario_impact(self, scenario: Dict) -> Dict:
         """Calculate impact metrics for scenario vs baseline"""
         try:
@@ -359,31 +612,36 @@ class CarbonScenarioModeler:
             total_reduction = baseline_total - scenario_total
             reduction_percentage = (total_reduction / baseline_total) * 100
             
-            # Annual reductions
-            annual_reductions = []
-            for i in range(len(baseline_proj['emissions'])):
-                reduction = baseline_proj['emissions'][i] - scenario_proj['emissions'][i]
-                annual_reductions.append(float(reduction))
+            # Annual reductions over the baseline timeline
+            num_years = len(baseline_proj['emissions'])
+            annual_reductions = (
+                np.asarray(baseline_proj['emissions'], dtype=np.float64) -
+                np.asarray(scenario_proj['emissions'][:num_years], dtype=np.float64)
+            )
+            
+            # Yearly reduction and cost totals shared by NPV and payback
+            effect_totals = None
+            if 'intervention_effects' in scenario_proj:
+                effect_totals = self._yearly_effect_totals(scenario_proj)
             
             # Cost effectiveness
             total_cost = scenario_proj['summary'].get('total_intervention_cost', 0)
             cost_per_tonne = total_cost / total_reduction if total_reduction > 0 else 0
             
             # Peak reduction year
-            peak_reduction_year = int(np.argmax(annual_reductions))
-            peak_reduction = max(annual_reductions)
+            peak_reduction_year = int(annual_reductions.argmax())
             
             return {
                 'total_emission_reduction': float(total_reduction),
                 'reduction_percentage': float(reduction_percentage),
-                'average_annual_reduction': float(np.mean(annual_reductions)),
-                'peak_reduction': float(peak_reduction),
+                'average_annual_reduction': float(annual_reductions.mean()),
+                'peak_reduction': float(annual_reductions[peak_reduction_year]),
                 'peak_reduction_year': baseline_proj['years'][peak_reduction_year],
                 'total_intervention_cost': float(total_cost),
                 'cost_per_tonne_co2': float(cost_per_tonne),
-                'annual_reductions': annual_reductions,
-                'net_present_value': self._calculate_npv(scenario),
-                'payback_period': self._calculate_payback_period(scenario)
+                'annual_reductions': annual_reductions.tolist(),
+                'net_present_value': self._calculate_npv(scenario, effect_totals=effect_totals),
+                'payback_period': self._calculate_payback_period(scenario, effect_totals)
             }
             
         except Exception as e:
@@ -455,62 +713,142 @@ class CarbonScenarioModeler:
                     reverse=True
                 )
             
-            # Select interventions to meet target
-            recommended = []
-            cumulative_reduction = 0
-            budget_used = 0
             max_budget = 1000000  # Example budget constraint
             
-            for intervention in available_interventions:
-                if cumulative_reduction >= target_reduction:
-                    break
+            # Select interventions to meet target
+            if strategy == 'cost_effective':
+                selected = self._select_within_budget(
+                    available_interventions, target_reduction, max_budget
+                )
+            else:
+                selected = []
+                cumulative_reduction = 0
+                budget_used = 0
                 
-                if budget_used + intervention['cost'] <= max_budget:
-                    recommended.append({
-                        **intervention,
-                        'start_year': datetime.now().year + len(recommended) + 1,
-                        'rationale': f"Selected for {strategy} strategy"
-                    })
-                    cumulative_reduction += intervention['annual_reduction']
-                    budget_used += intervention['cost']
-            
-            return recommended
+                for intervention in available_interventions:
+                    if cumulative_reduction >= target_reduction:
+                        break
+                    
+                    if budget_used + intervention['cost'] <= max_budget:
+                        selected.append(intervention)
+                        cumulative_reduction += intervention['annual_reduction']
+                        budget_used += intervention['cost']
+            
+            first_start_year = datetime.now().year + 1
+            return [
+                {
+                    **intervention,
+                    'start_year': first_start_year + i,
+                    'rationale': f"Selected for {strategy} strategy"
+                }
+                for i, intervention in enumerate(selected)
+            ]
             
         except Exception as e:
             logger.error(f"Error recommending interventions for target: {e}")
             return []
     
-    def _calculate_npv(self, scenario: Dict, discount_rate: float = 0.05) -> float:
-        """Calculate Net Present Value of scenario"""
+    def _select_within_budget(
+        self,
+        interventions: List[Dict],
+        target_reduction: float,
+        max_budget: float
+    ) -> List[Dict]:
+        """Cheapest set of interventions reaching the target within budget
+        
+        0/1 knapsack over $1k budget buckets maximising annual reduction. When
+        no affordable set reaches the target, the highest-reduction set is
+        used. Selected interventions keep their input order.
+        """
+        budget_units = int(max_budget // 1000)
+        best = np.zeros(budget_units + 1)
+        taken = np.zeros((len(interventions), budget_units + 1), dtype=bool)
+        
+        for i, intervention in enumerate(interventions):
+            cost_units = -(-int(intervention['cost']) // 1000)  # round up
+            if cost_units > budget_units:
+                continue
+            
+            candidate = best[:budget_units + 1 - cost_units] + intervention['annual_reduction']
+            improves = candidate > best[cost_units:]
+            taken[i, cost_units:] = improves
+            best[cost_units:] = np.where(improves, candidate, best[cost_units:])
+        
+        # Smallest budget meeting the target, else the full budget
+        meets_target = np.flatnonzero(best >= target_reduction)
+        remaining = int(meets_target[0]) if meets_target.size else budget_units
+        
+        chosen = []
+        for i in range(len(interventions) - 1, -1, -1):
+            if taken[i, remaining]:
+                chosen.append(i)
+                remaining -= -(-int(interventions[i]['cost']) // 1000)
+        
+        return [interventions[i] for i in sorted(chosen)]
+    
+    def _yearly_effect_totals(self, projections: Dict) -> Tuple[np.ndarray, np.ndarray]:
+        """Total emission reduction and intervention cost for each projection year"""
+        totals = projections.get('effect_totals')
+        if totals is not None:
+            return (
+                np.asarray(totals['annual_impact'], dtype=np.float64),
+                np.asarray(totals['costs'], dtype=np.float64)
+            )
+        
+        # Projections built elsewhere only carry the per-intervention effects
+        num_years = len(projections['emissions'])
+        effects = projections['intervention_effects']
+        
+        annual_impact = np.array(
+            [effect['annual_impact'] for effect in effects], dtype=np.float64
+        ).reshape(len(effects), num_years)
+        costs = np.array(
+            [effect['costs'] for effect in effects], dtype=np.float64
+        ).reshape(len(effects), num_years)
+        
+        return annual_impact.sum(axis=0), costs.sum(axis=0)
+    
+    def _calculate_npv(
+        self,
+        scenario: Dict,
+        discount_rate: float = 0.05,
+        effect_totals: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    ) -> float:
+        """Calculate Net Present Value of scenario
+        
+        effect_totals: precomputed (reductions, costs) from _yearly_effect_totals
+        """
         try:
             if 'intervention_effects' not in scenario['projections']:
                 return 0.0
             
-            npv = 0.0
             carbon_price = 50  # $/tonne CO2
             
-            for year, (cost, reduction) in enumerate(zip(
-                [sum(effect['costs'][year] for effect in scenario['projections']['intervention_effects']) 
-                 for year in range(len(scenario['projections']['emissions']))],
-                [sum(effect['annual_impact'][year] for effect in scenario['projections']['intervention_effects']) 
-                 for year in range(len(scenario['projections']['emissions']))]
-            )):
-                # Calculate cash flow (savings - costs)
-                savings = reduction * carbon_price
-                cash_flow = savings - cost
-                
-                # Discount to present value
-                pv = cash_flow / ((1 + discount_rate) ** year)
-                npv += pv
+            if effect_totals is None:
+                effect_totals = self._yearly_effect_totals(scenario['projections'])
+            reductions, costs = effect_totals
+            
+            # Cash flow (savings - costs) discounted to present value
+            cash_flows = reductions * carbon_price - costs
+            discount_factors = np.power(
+                1.0 + discount_rate, np.arange(len(cash_flows), dtype=np.float64)
+            )
             
-            return float(npv)
+            return float((cash_flows / discount_factors).sum())
             
         except Exception as e:
             logger.error(f"Error calculating NPV: {e}")
             return 0.0
     
-    def _calculate_payback_period(self, scenario: Dict) -> float:
-        """Calculate payback period in years"""
+    def _calculate_payback_period(
+        self,
+        scenario: Dict,
+        effect_totals: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    ) -> float:
+        """Calculate payback period in years
+        
+        effect_totals: precomputed (reductions, costs) from _yearly_effect_totals
+        """
         try:
             if 'intervention_effects' not in scenario['projections']:
                 return float('inf')
@@ -518,24 +856,45 @@ class CarbonScenarioModeler:
             total_cost = scenario['projections']['summary'].get('total_intervention_cost', 0)
             carbon_price = 50  # $/tonne CO2
             
-            cumulative_savings = 0
+            if effect_totals is None:
+                effect_totals = self._yearly_effect_totals(scenario['projections'])
+            reductions, _ = effect_totals
             
-            for year, reduction in enumerate([
-                sum(effect['annual_impact'][year] for effect in scenario['projections']['intervention_effects']) 
-                for year in range(len(scenario['projections']['emissions']))
-            ]):
-                annual_savings = reduction * carbon_price
-                cumulative_savings += annual_savings
-                
-                if cumulative_savings >= total_cost:
-                    return float(year)
+            # First year in which cumulative savings cover the total cost; the
+            # running maximum keeps the search valid if savings ever dip
+            cumulative_savings = np.maximum.accumulate(np.cumsum(reductions * carbon_price))
+            year = int(np.searchsorted(cumulative_savings, total_cost, side='left'))
             
-            return float('inf')
+            return float(year) if year < len(cumulative_savings) else float('inf')
             
         except Exception as e:
             logger.error(f"Error calculating payback period: {e}")
             return float('inf')
     
+    def _comparison_metrics(self, name: str, scenario: Dict) -> Dict:
+        """Key metrics used to compare a scenario against the others"""
+        summary = scenario['projections']['summary']
+        
+        if name == 'baseline':
+            return {
+                'total_emissions': summary['total_cumulative'],
+                'final_year_emissions': summary['final_year_emissions'],
+                'total_cost': 0,
+                'emission_reduction': 0,
+                'cost_per_tonne': 0,
+                'npv': 0
+            }
+        
+        impact = scenario.get('impact_metrics', {})
+        return {
+            'total_emissions': summary['total_cumulative'],
+            'final_year_emissions': summary['final_year_emissions'],
+            'total_cost': summary.get('total_intervention_cost', 0),
+            'emission_reduction': impact.get('total_emission_reduction', 0),
+            'cost_per_tonne': impact.get('cost_per_tonne_co2', 0),
+            'npv': impact.get('net_present_value', 0)
+        }
+    
     def compare_scenarios(self, scenario_names: List[str] = None) -> Dict:
         """Compare multiple scenarios"""
         try:
@@ -562,51 +921,39 @@ class CarbonScenarioModeler:
                 'comparison_charts': {}
             }
             
-            # Extract key metrics for each scenario
+            # Key metrics are extracted when each scenario is created
             for name, scenario in scenarios_to_compare.items():
-                if name == 'baseline':
-                    metrics = {
-                        'total_emissions': scenario['projections']['summary']['total_cumulative'],
-                        'final_year_emissions': scenario['projections']['summary']['final_year_emissions'],
-                        'total_cost': 0,
-                        'emission_reduction': 0,
-                        'cost_per_tonne': 0,
-                        'npv': 0
-                    }
+                if name == 'baseline' and scenario is self.baseline_scenario:
+                    metrics = self._baseline_metrics
+                elif self.scenarios.get(name) is scenario:
+                    metrics = self._scenario_metrics.get(name)
                 else:
-                    impact = scenario.get('impact_metrics', {})
-                    metrics = {
-                        'total_emissions': scenario['projections']['summary']['total_cumulative'],
-                        'final_year_emissions': scenario['projections']['summary']['final_year_emissions'],
-                        'total_cost': scenario['projections']['summary'].get('total_intervention_cost', 0),
-                        'emission_reduction': impact.get('total_emission_reduction', 0),
-                        'cost_per_tonne': impact.get('cost_per_tonne_co2', 0),
-                        'npv': impact.get('net_present_value', 0)
-                    }
+                    metrics = None
                 
-                comparison['comparison_metrics'][name] = metrics
+                if metrics is None:
+                    metrics = self._comparison_metrics(name, scenario)
+                
+                comparison['comparison_metrics'][name] = dict(metrics)
             
             # Find best scenarios for different criteria
             if len(scenarios_to_compare) > 1:
-                non_baseline_scenarios = {
-                    k: v for k, v in comparison['comparison_metrics'].items() 
-                    if k != 'baseline'
-                }
+                candidates = pd.DataFrame.from_dict(
+                    {
+                        k: v for k, v in comparison['comparison_metrics'].items()
+                        if k != 'baseline'
+                    },
+                    orient='index'
+                )
                 
-                if non_baseline_scenarios:
+                if not candidates.empty:
+                    # Scenarios without a positive cost per tonne rank last
+                    cost_per_tonne = candidates['cost_per_tonne'].where(
+                        candidates['cost_per_tonne'] > 0, np.inf
+                    )
                     comparison['best_scenario'] = {
-                        'highest_reduction': max(
-                            non_baseline_scenarios.items(), 
-                            key=lambda x: x[1]['emission_reduction']
-                        )[0],
-                        'most_cost_effective': min(
-                            non_baseline_scenarios.items(), 
-                            key=lambda x: x[1]['cost_per_tonne'] if x[1]['cost_per_tonne'] > 0 else float('inf')
-                        )[0],
-                        'highest_npv': max(
-                            non_baseline_scenarios.items(), 
-                            key=lambda x: x[1]['npv']
-                        )[0]
+                        'highest_reduction': candidates['emission_reduction'].idxmax(),
+                        'most_cost_effective': cost_per_tonne.idxmin(),
+                        'highest_npv': candidates['npv'].idxmax()
                     }
             
             # Generate trade-off analysis
@@ -696,30 +1043,38 @@ class CarbonScenarioModeler:
             scenarios = [(name, data) for name, data in metrics.items() if name != 'baseline']
             
             if len(scenarios) >= 2:
-                # Sort by emission reduction
-                by_reduction = sorted(scenarios, key=lambda x: x[1]['emission_reduction'], reverse=True)
-                # Sort by cost
-                by_cost = sorted(scenarios, key=lambda x: x[1]['total_cost'])
+                # Columns: emission reduction, total cost, cost per tonne, NPV
+                values = np.array(
+                    [
+                        [d['emission_reduction'], d['total_cost'], d['cost_per_tonne'], d['npv']]
+                        for _, d in scenarios
+                    ],
+                    dtype=np.float64
+                )
+                
+                # Highest reduction vs lowest cost (first scenario wins ties)
+                highest_reduction = scenarios[int(values[:, 0].argmax())][0]
+                lowest_cost = scenarios[int(values[:, 1].argmin())][0]
                 
-                if by_reduction[0][0] != by_cost[0][0]:
+                if highest_reduction != lowest_cost:
                     trade_offs.append(
-                        f"{by_reduction[0][0]} achieves highest reduction but at higher cost than {by_cost[0][0]}"
+                        f"{highest_reduction} achieves highest reduction but at higher cost than {lowest_cost}"
                     )
                 
                 # Compare cost effectiveness
-                cost_effective = [s for s in scenarios if s[1]['cost_per_tonne'] > 0]
-                if cost_effective:
-                    most_efficient = min(cost_effective, key=lambda x: x[1]['cost_per_tonne'])
+                cost_effective = np.flatnonzero(values[:, 2] > 0)
+                if cost_effective.size:
+                    name, data = scenarios[int(cost_effective[values[cost_effective, 2].argmin()])]
                     trade_offs.append(
-                        f"{most_efficient[0]} offers best cost per tonne CO2 at ${most_efficient[1]['cost_per_tonne']:.2f}"
+                        f"{name} offers best cost per tonne CO2 at ${data['cost_per_tonne']:.2f}"
                     )
                 
                 # NPV analysis
-                positive_npv = [s for s in scenarios if s[1]['npv'] > 0]
-                if positive_npv:
-                    best_npv = max(positive_npv, key=lambda x: x[1]['npv'])
+                positive_npv = np.flatnonzero(values[:, 3] > 0)
+                if positive_npv.size:
+                    name, data = scenarios[int(positive_npv[values[positive_npv, 3].argmax()])]
                     trade_offs.append(
-                        f"{best_npv[0]} offers best financial return with NPV of ${best_npv[1]['npv']:,.2f}"
+                        f"{name} offers best financial return with NPV of ${data['npv']:,.2f}"
                     )
             
             return trade_offs
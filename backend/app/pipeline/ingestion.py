@@ -1,6 +1,10 @@
 import logging
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional
 from datetime import datetime
+from sqlalchemy import literal_column
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from app.pipeline.api_clients import EPAClient, DEFRAClient, IPCCClient
 from app.pipeline.transformers import EmissionFactorTransformer
@@ -9,6 +13,13 @@ from app.db.models.emissions import EmissionFactor
 
 logger = logging.getLogger(__name__)
 
+# Columns that identify an emission factor across syncs
+FACTOR_KEY = ('name', 'source', 'category', 'region', 'year')
+FACTOR_COLUMNS = tuple(column.name for column in EmissionFactor.__table__.columns if column.name != 'id')
+
+# Rows per upsert statement, well under Postgres' bind parameter limit
+UPSERT_CHUNK_SIZE = 500
+
 class DataIngestionPipeline:
     """Main data ingestion pipeline for emission factors"""
     
@@ -34,21 +45,21 @@ class DataIngestionPipeline:
             'sources': {}
         }
         
+        # Fetch every source concurrently; database writes stay on this thread
+        fetchers = {
+            'EPA': self._fetch_epa_data,
+            'DEFRA': self._fetch_defra_data,
+            'IPCC': self._fetch_ipcc_data
+        }
+        
         try:
-            # Sync from EPA
-            epa_results = self._sync_epa_data()
-            sync_results['sources']['EPA'] = epa_results
-            self._update_totals(sync_results, epa_results)
-            
-            # Sync from DEFRA
-            defra_results = self._sync_defra_data()
-            sync_results['sources']['DEFRA'] = defra_results
-            self._update_totals(sync_results, defra_results)
-            
-            # Sync from IPCC
-            ipcc_results = self._sync_ipcc_data()
-            sync_results['sources']['IPCC'] = ipcc_results
-            self._update_totals(sync_results, ipcc_results)
+            with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+                futures = {source: executor.submit(fetch) for source, fetch in fetchers.items()}
+                
+                for source, future in futures.items():
+                    source_results = self._sync_source(source, future.result)
+                    sync_results['sources'][source] = source_results
+                    self._update_totals(sync_results, source_results)
             
             logger.info(f"Full sync completed: {sync_results}")
             
@@ -61,98 +72,98 @@ class DataIngestionPipeline:
     
     def _sync_epa_data(self) -> Dict[str, int]:
         """Sync data from EPA"""
-        logger.info("Syncing EPA data")
-        
-        try:
-            # Get current year data
-            current_year = datetime.now().year
-            raw_data = self.epa_client.get_emission_factors(current_year)
-            
-            return self._process_source_data(raw_data, 'EPA')
-        
-        except Exception as e:
-            logger.error(f"Error syncing EPA data: {e}")
-            return {'processed': 0, 'inserted': 0, 'updated': 0, 'errors': 1}
+        return self._sync_source('EPA', self._fetch_epa_data)
     
     def _sync_defra_data(self) -> Dict[str, int]:
         """Sync data from DEFRA"""
-        logger.info("Syncing DEFRA data")
-        
-        try:
-            # Get UK emission factors
-            raw_data = self.defra_client.get_uk_emission_factors()
-            
-            return self._process_source_data(raw_data, 'DEFRA')
-        
-        except Exception as e:
-            logger.error(f"Error syncing DEFRA data: {e}")
-            return {'processed': 0, 'inserted': 0, 'updated': 0, 'errors': 1}
+        return self._sync_source('DEFRA', self._fetch_defra_data)
     
     def _sync_ipcc_data(self) -> Dict[str, int]:
         """Sync data from IPCC"""
-        logger.info("Syncing IPCC data")
+        return self._sync_source('IPCC', self._fetch_ipcc_data)
+    
+    def _fetch_epa_data(self) -> List[Dict]:
+        """Fetch current year data from EPA"""
+        current_year = datetime.now().year
+        return self.epa_client.get_emission_factors(current_year)
+    
+    def _fetch_defra_data(self) -> List[Dict]:
+        """Fetch UK emission factors from DEFRA"""
+        return self.defra_client.get_uk_emission_factors()
+    
+    def _fetch_ipcc_data(self) -> List[Dict]:
+        """Fetch Global Warming Potentials from IPCC"""
+        return self.ipcc_client.get_global_warming_potentials('AR6')
+    
+    def _sync_source(self, source: str, fetch: Callable[[], List[Dict]]) -> Dict[str, int]:
+        """Fetch and process data from a single source"""
+        logger.info(f"Syncing {source} data")
         
         try:
-            # Get Global Warming Potentials
-            raw_data = self.ipcc_client.get_global_warming_potentials('AR6')
+            raw_data = fetch()
             
-            return self._process_source_data(raw_data, 'IPCC')
+            return self._process_source_data(raw_data, source)
         
         except Exception as e:
-            logger.error(f"Error syncing IPCC data: {e}")
+            logger.error(f"Error syncing {source} data: {e}")
             return {'processed': 0, 'inserted': 0, 'updated': 0, 'errors': 1}
     
-    def _process_source_data(self, raw_data: List[Dict], source: str) -> Dict[str, int]:
-        """Process data from a specific source"""
+    def _process_source_data(self, raw_data: Iterable[Dict], source: str) -> Dict[str, int]:
+        """Process data from a specific source in fixed-size chunks"""
         results = {'processed': 0, 'inserted': 0, 'updated': 0, 'errors': 0}
         
-        # Transform data
-        transformed_data = self.transformer.transform(raw_data)
-        results['processed'] = len(transformed_data)
+        current_year = datetime.now().year
+        raw_items = iter(raw_data)
         
-        # Assess data quality
-        quality_assessed_data = self.quality_assessor.assess_data_quality(transformed_data)
+        try:
+            while True:
+                chunk = list(islice(raw_items, UPSERT_CHUNK_SIZE))
+                if not chunk:
+                    break
+                
+                # Transform data
+                transformed_data = self.transformer.transform(chunk, current_year)
+                results['processed'] += len(transformed_data)
+                
+                # Drop duplicate keys before scoring, keeping the last row like sequential saves did
+                unique_factors = {}
+                for factor_data in transformed_data:
+                    unique_factors[tuple(factor_data[column] for column in FACTOR_KEY)] = factor_data
+                
+                # Assess data quality
+                quality_assessed_data = self.quality_assessor.assess_data_quality(list(unique_factors.values()), current_year)
+                
+                # Save the chunk in a single upsert
+                rows = [{column: factor_data.get(column) for column in FACTOR_COLUMNS}
+                        for factor_data in quality_assessed_data]
+                
+                if rows:
+                    results['inserted'] += self._upsert_emission_factors(rows)
+            
+            self.db.commit()
+            results['updated'] = results['processed'] - results['inserted']
         
-        # Save to database
-        for factor_data in quality_assessed_data:
-            try:
-                is_new = self._save_emission_factor(factor_data)
-                if is_new:
-                    results['inserted'] += 1
-                else:
-                    results['updated'] += 1
-            except Exception as e:
-                logger.error(f"Error saving factor {factor_data.get('name')}: {e}")
-                results['errors'] += 1
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Error saving {source} factors: {e}")
+            results['inserted'] = 0
+            results['errors'] = results['processed']
         
         logger.info(f"{source} sync results: {results}")
         return results
     
-    def _save_emission_factor(self, factor_data: Dict) -> bool:
-        """Save emission factor to database, return True if new"""
-        # Check if factor already exists
-        existing_factor = self.db.query(EmissionFactor).filter(
-            EmissionFactor.name == factor_data['name'],
-            EmissionFactor.source == factor_data['source'],
-            EmissionFactor.category == factor_data['category'],
-            EmissionFactor.region == factor_data['region'],
-            EmissionFactor.year == factor_data['year']
-        ).first()
+    def _upsert_emission_factors(self, rows: List[Dict]) -> int:
+        """Insert or update emission factors in one statement, return number inserted"""
+        # Core insert against the table, so no ORM state is built for the rows
+        table = EmissionFactor.__table__
+        stmt = insert(table).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(FACTOR_KEY),
+            set_={column: stmt.excluded[column] for column in FACTOR_COLUMNS if column not in FACTOR_KEY}
+        ).returning(table.c.id, literal_column('xmax = 0').label('inserted'))
         
-        if existing_factor:
-            # Update existing factor
-            for key, value in factor_data.items():
-                if hasattr(existing_factor, key) and key != 'metadata':
-                    setattr(existing_factor, key, value)
-            self.db.commit()
-            return False
-        else:
-            # Create new factor (remove metadata for now since it might cause issues)
-            factor_data_clean = {k: v for k, v in factor_data.items() if k != 'metadata'}
-            new_factor = EmissionFactor(**factor_data_clean)
-            self.db.add(new_factor)
-            self.db.commit()
-            return True
+        returned = self.db.execute(stmt).all()
+        return sum(1 for row in returned if row.inserted)
     
     def _update_totals(self, sync_results: Dict, source_results: Dict):
         """Update total counts in sync results"""
@@ -1,6 +1,8 @@
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import logging
+from collections import Counter
+import numpy as np
 from sqlalchemy.orm import Session
 from app.db.models.emissions import EmissionFactor
 
@@ -12,112 +14,118 @@ class DataQualityAssessor:
     def __init__(self, db: Session = None):
         self.db = db
     
-    def assess_data_quality(self, emission_factors: List[Dict]) -> List[Dict]:
+    def assess_data_quality(self, emission_factors: List[Dict], current_year: Optional[int] = None) -> List[Dict]:
         """Assess data quality for a list of emission factors"""
         assessed_factors = []
+        scores, all_issues = self._calculate_quality_scores(emission_factors, current_year)
         
-        for factor in emission_factors:
-            quality_score, quality_issues = self._calculate_quality_score(factor)
+        log_rows = logger.isEnabledFor(logging.DEBUG)
+        issue_counts = Counter()
+        
+        for factor, quality_score, quality_issues in zip(emission_factors, scores, all_issues):
             factor['data_quality'] = quality_score
             factor['quality_issues'] = quality_issues
             assessed_factors.append(factor)
+            issue_counts.update(quality_issues)
             
-            logger.info(f"Quality assessment: {factor.get('name')} - Score: {quality_score}/5.0")
-            if quality_issues:
-                logger.warning(f"Quality issues: {', '.join(quality_issues)}")
+            if log_rows:
+                logger.debug("Quality assessment: %s - Score: %s/5.0", factor.get('name'), quality_score)
+                if quality_issues:
+                    logger.debug("Quality issues: %s", ', '.join(quality_issues))
+        
+        # One summary per batch instead of a log line per factor
+        if scores:
+            logger.info("Quality assessment: %d factors, average score %.2f/5.0", len(scores), sum(scores) / len(scores))
+        if issue_counts:
+            logger.warning("Quality issues: %s", ', '.join(f"{issue} ({count})" for issue, count in issue_counts.most_common(5)))
         
         return assessed_factors
     
     def _calculate_quality_score(self, factor: Dict) -> Tuple[float, List[str]]:
         """Calculate comprehensive data quality score (1-5 scale)"""
-        issues = []
+        scores, issues = self._calculate_quality_scores([factor])
+        return scores[0], issues[0]
+    
+    def _calculate_quality_scores(self, factors: List[Dict],
+                                  current_year: Optional[int] = None) -> Tuple[List[float], List[List[str]]]:
+        """Calculate quality scores for a batch of factors with array operations"""
+        issues = [[] for _ in factors]
         
         # Completeness check (40% weight)
-        completeness_score, completeness_issues = self._assess_completeness(factor)
-        issues.extend(completeness_issues)
+        completeness_score = self._assess_completeness(factors, issues)
         
         # Accuracy check (30% weight)
-        accuracy_score, accuracy_issues = self._assess_accuracy(factor)
-        issues.extend(accuracy_issues)
+        accuracy_score = self._assess_accuracy(factors, issues)
         
         # Timeliness check (30% weight)
-        timeliness_score, timeliness_issues = self._assess_timeliness(factor)
-        issues.extend(timeliness_issues)
+        timeliness_score = self._assess_timeliness(factors, issues, current_year or datetime.now().year)
         
         # Calculate weighted average
         final_score = (completeness_score * 0.4 + accuracy_score * 0.3 + timeliness_score * 0.3)
         
-        return round(max(1.0, min(5.0, final_score)), 2), issues
+        return [round(score, 2) for score in np.clip(final_score, 1.0, 5.0).tolist()], issues
     
-    def _assess_completeness(self, factor: Dict) -> Tuple[float, List[str]]:
+    def _assess_completeness(self, factors: List[Dict], issues: List[List[str]]) -> np.ndarray:
         """Assess data completeness"""
-        score = 5.0
-        issues = []
-        
         required_fields = ['name', 'scope', 'category', 'factor_value', 'unit', 'source']
         optional_fields = ['subcategory', 'region', 'uncertainty', 'metadata']
         
-        # Check required fields
-        missing_required = [field for field in required_fields if not factor.get(field)]
-        if missing_required:
-            score -= len(missing_required) * 0.8  # More severe penalty
-            issues.append(f"Missing required fields: {', '.join(missing_required)}")
+        missing_required = np.array(
+            [[not factor.get(field) for field in required_fields] for factor in factors], dtype=bool
+        ).reshape(len(factors), len(required_fields))
+        missing_optional = np.array(
+            [[not factor.get(field) for field in optional_fields] for factor in factors], dtype=bool
+        ).reshape(len(factors), len(optional_fields))
         
-        # Check optional fields
-        missing_optional = [field for field in optional_fields if not factor.get(field)]
-        if missing_optional:
-            score -= len(missing_optional) * 0.1  # Minor penalty
+        # More severe penalty for required fields, minor penalty for optional ones
+        score = 5.0 - missing_required.sum(axis=1) * 0.8
+        score = score - missing_optional.sum(axis=1) * 0.1
         
-        return max(1.0, score), issues
+        for i in np.flatnonzero(missing_required.any(axis=1)):
+            missing = [field for field, flag in zip(required_fields, missing_required[i]) if flag]
+            issues[i].append(f"Missing required fields: {', '.join(missing)}")
+        
+        return np.maximum(score, 1.0)
     
-    def _assess_accuracy(self, factor: Dict) -> Tuple[float, List[str]]:
+    def _assess_accuracy(self, factors: List[Dict], issues: List[List[str]]) -> np.ndarray:
         """Assess data accuracy"""
-        score = 5.0
-        issues = []
-        
-        # Check for reasonable factor values
-        factor_value = factor.get('factor_value', 0)
-        if factor_value <= 0:
-            score -= 3.0  # Severe penalty for invalid values
-            issues.append("Factor value is zero or negative")
-        elif factor_value > 10000:  # Unreasonably high
-            score -= 1.0
-            issues.append("Factor value seems unreasonably high")
-        
-        # Check uncertainty if provided
-        uncertainty = factor.get('uncertainty')
-        if uncertainty and uncertainty > 100:
-            score -= 0.5
-            issues.append("Uncertainty value seems unreasonably high")
-        
-        # Check unit consistency
-        unit = factor.get('unit', '')
-        if not any(expected in unit.lower() for expected in ['co2', 'co2e', 'carbon']):
-            score -= 1.0  # Penalty for wrong unit
-            issues.append("Unit doesn't appear to be CO2 equivalent")
-        
-        return max(1.0, score), issues
+        factor_value = np.array([factor.get('factor_value', 0) for factor in factors], dtype=float)
+        uncertainty = np.array([factor.get('uncertainty') or 0.0 for factor in factors], dtype=float)
+        
+        # Severe penalty for invalid values, smaller one for unreasonably high values
+        non_positive = factor_value <= 0
+        too_high = factor_value > 10000
+        score = np.select([non_positive, too_high], [5.0 - 3.0, 5.0 - 1.0], 5.0)
+        
+        high_uncertainty = uncertainty > 100
+        score = np.where(high_uncertainty, score - 0.5, score)
+        
+        # Penalty for units that aren't CO2 equivalent
+        wrong_unit = np.array([
+            not any(expected in factor.get('unit', '').lower() for expected in ['co2', 'co2e', 'carbon'])
+            for factor in factors
+        ], dtype=bool)
+        score = np.where(wrong_unit, score - 1.0, score)
+        
+        for i in range(len(factors)):
+            if non_positive[i]:
+                issues[i].append("Factor value is zero or negative")
+            elif too_high[i]:
+                issues[i].append("Factor value seems unreasonably high")
+            if high_uncertainty[i]:
+                issues[i].append("Uncertainty value seems unreasonably high")
+            if wrong_unit[i]:
+                issues[i].append("Unit doesn't appear to be CO2 equivalent")
+        
+        return np.maximum(score, 1.0)
     
-    def _assess_timeliness(self, factor: Dict) -> Tuple[float, List[str]]:
+    def _assess_timeliness(self, factors: List[Dict], issues: List[List[str]], current_year: int) -> np.ndarray:
         """Assess data timeliness"""
-        score = 5.0
-        issues = []
-        
-        current_year = datetime.now().year
-        data_year = factor.get('year', current_year)
-        
-        age = current_year - data_year
-        
-        if age > 10:  # Very old data
-            score -= 3.0
-            issues.append(f"Data is {age} years old")
-        elif age > 5:
-            score -= 2.0
-            issues.append(f"Data is {age} years old")
-        elif age > 3:
-            score -= 1.0
-            issues.append(f"Data is {age} years old")
-        elif age > 1:
-            score -= 0.5
-        
-        return max(1.0, score), issues
+        age = current_year - np.array([factor.get('year', current_year) for factor in factors], dtype=int)
+        
+        score = np.select([age > 10, age > 5, age > 3, age > 1], [5.0 - 3.0, 5.0 - 2.0, 5.0 - 1.0, 5.0 - 0.5], 5.0)
+        
+        for i in np.flatnonzero(age > 3):
+            issues[i].append(f"Data is {age[i]} years old")
+        
+        return np.maximum(score, 1.0)
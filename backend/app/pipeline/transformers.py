@@ -1,45 +1,73 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+_SCOPE_PATTERN = re.compile(r'scope ?([123])')
+_SCOPE_2_KEYWORDS = re.compile(r'electricity|grid')
+_SCOPE_3_KEYWORDS = re.compile(r'transport|delivery|waste|purchased')
+
+_UNIT_MAPPING = {
+    'kg co2e/mwh': 'kg CO2e/MWh',
+    'kg co2e/kwh': 'kg CO2e/kWh',
+    'kg co2e/unit': 'kg CO2e/unit',
+    'kg co2e/liter': 'kg CO2e/L',
+    'kg co2e/gallon': 'kg CO2e/gal',
+    'kg co2e/kg': 'kg CO2e/kg',
+    'kg co2e/tonne': 'kg CO2e/t'
+}
+
+def _clean_text(value) -> str:
+    """Strip a text field, only converting values that are not already strings"""
+    return value.strip() if isinstance(value, str) else str(value).strip()
+
 class EmissionFactorTransformer:
     """Transform emission factor data from various sources"""
     
-    def transform(self, raw_data: List[Dict]) -> List[Dict]:
+    def transform(self, raw_data: List[Dict], current_year: Optional[int] = None) -> List[Dict]:
         """Transform raw emission factor data"""
         transformed_data = []
+        rejected = 0
+        current_year = current_year or datetime.now().year
+        updated_at = datetime.utcnow()
         
         for item in raw_data:
             try:
-                transformed_item = self._transform_item(item)
-                if self.validate(transformed_item):
+                transformed_item = self._transform_item(item, current_year, updated_at)
+                if self.validate(transformed_item, current_year):
                     transformed_data.append(transformed_item)
                 else:
-                    logger.warning(f"Validation failed for item: {item.get('name', 'Unknown')}")
+                    rejected += 1
+                    logger.debug("Validation failed for item: %s", item.get('name', 'Unknown'))
             except Exception as e:
                 logger.error(f"Error transforming item {item.get('name', 'Unknown')}: {e}")
                 continue
         
-        logger.info(f"Transformed {len(transformed_data)} out of {len(raw_data)} items")
+        logger.info("Transformed %d out of %d items", len(transformed_data), len(raw_data))
+        if rejected:
+            logger.warning("%d items failed validation", rejected)
         return transformed_data
     
-    def _transform_item(self, item: Dict) -> Dict:
+    def _transform_item(self, item: Dict, current_year: int, updated_at: datetime) -> Dict:
         """Transform a single emission factor item"""
+        subcategory = item.get('subcategory')
+        uncertainty = item.get('uncertainty')
+        unit = item.get('unit', '')
         return {
-            'name': str(item.get('name', '')).strip(),
+            'name': _clean_text(item.get('name', '')),
             'scope': self._standardize_scope(item.get('scope', '')),
-            'category': str(item.get('category', '')).strip(),
-            'subcategory': str(item.get('subcategory', '')).strip() if item.get('subcategory') else None,
+            'category': _clean_text(item.get('category', '')),
+            'subcategory': _clean_text(subcategory) if subcategory else None,
             'factor_value': self._clean_numeric_value(item.get('factor_value', 0)),
-            'unit': self._standardize_unit(str(item.get('unit', ''))),
-            'source': str(item.get('source', '')).strip(),
-            'region': str(item.get('region', 'Global')).strip(),
-            'year': int(item.get('year', datetime.now().year)),
-            'uncertainty': self._clean_numeric_value(item.get('uncertainty')) if item.get('uncertainty') else None,
+            'unit': self._standardize_unit(unit if isinstance(unit, str) else str(unit)),
+            'source': _clean_text(item.get('source', '')),
+            'region': _clean_text(item.get('region', 'Global')),
+            'year': int(item.get('year', current_year)),
+            'uncertainty': self._clean_numeric_value(uncertainty) if uncertainty else None,
             'data_quality': min(5.0, max(1.0, self._clean_numeric_value(item.get('data_quality', 3.0)))),
-            'last_updated': datetime.utcnow(),
+            'last_updated': updated_at,
             'is_active': True,
             'metadata': item.get('metadata', {})
         }
@@ -48,34 +76,22 @@ class EmissionFactorTransformer:
         """Standardize scope naming"""
         scope_lower = str(scope).lower()
         
-        if 'scope 1' in scope_lower or 'scope1' in scope_lower:
-            return 'SCOPE_1'
-        elif 'scope 2' in scope_lower or 'scope2' in scope_lower:
+        # The lowest explicit scope number wins, matching the old check order
+        explicit = _SCOPE_PATTERN.findall(scope_lower)
+        if explicit:
+            return f'SCOPE_{min(explicit)}'
+        
+        # Try to infer from content
+        if _SCOPE_2_KEYWORDS.search(scope_lower):
             return 'SCOPE_2'
-        elif 'scope 3' in scope_lower or 'scope3' in scope_lower:
+        elif _SCOPE_3_KEYWORDS.search(scope_lower):
             return 'SCOPE_3'
         else:
-            # Try to infer from content
-            if 'electricity' in scope_lower or 'grid' in scope_lower:
-                return 'SCOPE_2'
-            elif any(word in scope_lower for word in ['transport', 'delivery', 'waste', 'purchased']):
-                return 'SCOPE_3'
-            else:
-                return 'SCOPE_1'
+            return 'SCOPE_1'
     
     def _standardize_unit(self, unit: str) -> str:
         """Standardize unit naming"""
-        unit_mapping = {
-            'kg co2e/mwh': 'kg CO2e/MWh',
-            'kg co2e/kwh': 'kg CO2e/kWh',
-            'kg co2e/unit': 'kg CO2e/unit',
-            'kg co2e/liter': 'kg CO2e/L',
-            'kg co2e/gallon': 'kg CO2e/gal',
-            'kg co2e/kg': 'kg CO2e/kg',
-            'kg co2e/tonne': 'kg CO2e/t'
-        }
-        
-        return unit_mapping.get(unit.lower().strip(), unit)
+        return _UNIT_MAPPING.get(unit.lower().strip(), unit)
     
     def _clean_numeric_value(self, value) -> float:
         """Clean and convert numeric values"""
@@ -90,31 +106,31 @@ class EmissionFactorTransformer:
             logger.warning(f"Could not convert value to float: {value}")
             return 0.0
     
-    def validate(self, data: Dict) -> bool:
+    def validate(self, data: Dict, current_year: Optional[int] = None) -> bool:
         """Validate transformed emission factor data"""
         required_fields = ['name', 'scope', 'category', 'factor_value', 'unit', 'source']
         
         # Check required fields
         for field in required_fields:
             if not data.get(field):
-                logger.warning(f"Missing required field: {field}")
+                logger.debug("Missing required field: %s", field)
                 return False
         
         # Validate numeric fields
         if data['factor_value'] <= 0:
-            logger.warning(f"Invalid factor_value: {data['factor_value']}")
+            logger.debug("Invalid factor_value: %s", data['factor_value'])
             return False
         
         # Validate scope
         valid_scopes = ['SCOPE_1', 'SCOPE_2', 'SCOPE_3']
         if data['scope'] not in valid_scopes:
-            logger.warning(f"Invalid scope: {data['scope']}")
+            logger.debug("Invalid scope: %s", data['scope'])
             return False
         
         # Validate year
-        current_year = datetime.now().year
+        current_year = current_year or datetime.now().year
         if data['year'] < 1990 or data['year'] > current_year + 1:
-            logger.warning(f"Invalid year: {data['year']}")
+            logger.debug("Invalid year: %s", data['year'])
             return False
         
         return True
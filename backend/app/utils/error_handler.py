@@ -1,4 +1,5 @@
 import logging
+import random
 import time
 import functools
 from typing import Any, Callable
@@ -7,61 +8,80 @@ from sqlalchemy.exc import SQLAlchemyError
 
 logger = logging.getLogger(__name__)
 
+# Upper bound in seconds for a single retry backoff
+MAX_BACKOFF = 60
+
 def handle_api_error(max_retries: int = 3):
     """Decorator for handling API errors with retry logic"""
     
+    # Allow bare @handle_api_error as well as @handle_api_error(max_retries=...)
+    if callable(max_retries):
+        return handle_api_error()(max_retries)
+    
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            base_delay = 1
-            rate_limit_retries = 0  # Separate counter for rate limit retries
-            
-            for attempt in range(max_retries):
-                try:
-                    return func(*args, **kwargs)
-                
-                except requests.exceptions.Timeout as e:
-                    logger.warning(f"Timeout on attempt {attempt + 1}: {e}")
-                    if attempt == max_retries - 1:
-                        raise
-                    time.sleep(base_delay * (2 ** attempt))
-                
-                except requests.exceptions.HTTPError as e:
-                    if e.response.status_code == 429:  # Rate limited
-                        rate_limit_retries += 1
-                        if rate_limit_retries >= max_retries:
-                            logger.error(f"Rate limit retries exhausted after {rate_limit_retries} attempts")
-                            raise  # Raise the error after max retries
-                        
-                        retry_after = int(e.response.headers.get('Retry-After', 60))
-                        logger.warning(f"Rate limited, waiting {retry_after} seconds")
-                        time.sleep(retry_after)
-                        continue  # Don't count this as a regular attempt
-                    elif e.response.status_code >= 500:  # Server error
-                        logger.warning(f"Server error on attempt {attempt + 1}: {e}")
-                        if attempt == max_retries - 1:
-                            raise
-                        time.sleep(base_delay * (2 ** attempt))
-                    else:
-                        # Client error, don't retry
-                        raise
-                
-                except requests.exceptions.ConnectionError as e:
-                    logger.warning(f"Connection error on attempt {attempt + 1}: {e}")
-                    if attempt == max_retries - 1:
-                        raise
-                    time.sleep(base_delay * (2 ** attempt))
-                
-                except Exception as e:
-                    logger.error(f"Unexpected error in {func.__name__}: {e}")
-                    raise
+            return _call_with_retries(func, args, kwargs, max_retries)
         
         return wrapper
     return decorator
 
-def handle_database_error(func: Callable) -> Callable:
+def _call_with_retries(func: Callable, args: tuple, kwargs: dict, max_retries: int) -> Any:
+    """Call func, retrying timeouts, server errors, rate limits and connection errors"""
+    base_delay = 1
+    backoff = base_delay  # Decorrelated jitter so retrying callers don't wake together
+    rate_limit_retries = 0  # Separate counter for rate limit retries
+    
+    for attempt in range(max_retries):
+        try:
+            return func(*args, **kwargs)
+        
+        except requests.exceptions.Timeout as e:
+            logger.warning(f"Timeout on attempt {attempt + 1}: {e}")
+            if attempt == max_retries - 1:
+                raise
+            backoff = random.uniform(base_delay, min(MAX_BACKOFF, backoff * 3))
+            time.sleep(backoff)
+        
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code == 429:  # Rate limited
+                rate_limit_retries += 1
+                if rate_limit_retries >= max_retries:
+                    logger.error(f"Rate limit retries exhausted after {rate_limit_retries} attempts")
+                    raise  # Raise the error after max retries
+                
+                retry_after = int(e.response.headers.get('Retry-After', 60))
+                logger.warning(f"Rate limited, waiting {retry_after} seconds")
+                time.sleep(retry_after)
+                continue  # Don't count this as a regular attempt
+            elif e.response.status_code >= 500:  # Server error
+                logger.warning(f"Server error on attempt {attempt + 1}: {e}")
+                if attempt == max_retries - 1:
+                    raise
+                backoff = random.uniform(base_delay, min(MAX_BACKOFF, backoff * 3))
+                time.sleep(backoff)
+            else:
+                # Client error, don't retry
+                raise
+        
+        except requests.exceptions.ConnectionError as e:
+            logger.warning(f"Connection error on attempt {attempt + 1}: {e}")
+            if attempt == max_retries - 1:
+                raise
+            backoff = random.uniform(base_delay, min(MAX_BACKOFF, backoff * 3))
+            time.sleep(backoff)
+        
+        except Exception as e:
+            logger.error(f"Unexpected error in {func.__name__}: {e}")
+            raise
+
+def handle_database_error(func: Callable = None, *, session_attr: str = 'db') -> Callable:
     """Decorator for handling database errors"""
     
+    # Allow @handle_database_error(session_attr=...) as well as the bare decorator
+    if func is None:
+        return functools.partial(handle_database_error, session_attr=session_attr)
+    
     @functools.wraps(func)
     def wrapper(*args, **kwargs) -> Any:
         try:
@@ -69,8 +89,10 @@ def handle_database_error(func: Callable) -> Callable:
         except SQLAlchemyError as e:
             logger.error(f"Database error in {func.__name__}: {e}")
             # Rollback transaction if session is available
-            if hasattr(args[0], 'db') and hasattr(args[0].db, 'rollback'):
-                args[0].db.rollback()
+            session = getattr(args[0], session_attr, None) if args else None
+            rollback = getattr(session, 'rollback', None)
+            if rollback is not None:
+                rollback()
             raise
         except Exception as e:
             logger.error(f"Unexpected error in {func.__name__}: {e}")
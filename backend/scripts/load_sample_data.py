@@ -10,48 +10,51 @@ def load_sample_data():
     try:
         # Sample companies
         companies = [
-            Company(
-                name="EcoTech Industries",
-                registration_number="12345678",
-                industry_sector="Technology",
-                country="US",
-                reporting_year=2023
-            ),
-            Company(
-                name="Green Manufacturing Ltd",
-                registration_number="87654321",
-                industry_sector="Manufacturing",
-                country="UK",
-                reporting_year=2023
-            )
+            {
+                'name': "EcoTech Industries",
+                'registration_number': "12345678",
+                'industry_sector': "Technology",
+                'country': "US",
+                'reporting_year': 2023
+            },
+            {
+                'name': "Green Manufacturing Ltd",
+                'registration_number': "87654321",
+                'industry_sector': "Manufacturing",
+                'country': "UK",
+                'reporting_year': 2023
+            }
         ]
         
-        # Sample emission factors
+        # Sample emission factors (every row carries the same keys for executemany)
         emission_factors = [
-            EmissionFactor(
-                name="Natural Gas - Stationary Combustion",
-                scope=ScopeEnum.SCOPE_1,
-                category="Stationary Combustion",
-                factor_value=0.0539,
-                unit="kg CO2e/kWh",
-                source="EPA eGRID 2021",
-                region="US",
-                year=2023
-            ),
-            EmissionFactor(
-                name="Electricity - US Grid Average",
-                scope=ScopeEnum.SCOPE_2,
-                category="Electricity",
-                factor_value=0.4091,
-                unit="kg CO2e/kWh",
-                source="EPA eGRID 2021",
-                region="US",
-                year=2023,
-                uncertainty=15.0
-            )
+            {
+                'name': "Natural Gas - Stationary Combustion",
+                'scope': ScopeEnum.SCOPE_1,
+                'category': "Stationary Combustion",
+                'factor_value': 0.0539,
+                'unit': "kg CO2e/kWh",
+                'source': "EPA eGRID 2021",
+                'region': "US",
+                'year': 2023,
+                'uncertainty': None
+            },
+            {
+                'name': "Electricity - US Grid Average",
+                'scope': ScopeEnum.SCOPE_2,
+                'category': "Electricity",
+                'factor_value': 0.4091,
+                'unit': "kg CO2e/kWh",
+                'source': "EPA eGRID 2021",
+                'region': "US",
+                'year': 2023,
+                'uncertainty': 15.0
+            }
         ]
         
-        db.add_all(companies + emission_factors)
+        # Core inserts skip ORM instance and unit-of-work overhead
+        db.execute(Company.__table__.insert(), companies)
+        db.execute(EmissionFactor.__table__.insert(), emission_factors)
         db.commit()
         
         print("Sample data loaded successfully!")
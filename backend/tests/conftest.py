@@ -1,39 +1,80 @@
 import pytest
 import sys
 import os
+from types import MappingProxyType
 from unittest.mock import Mock
 
 # Add backend to path
 backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, backend_dir)
 
+@pytest.fixture(scope="session")
+def engine():
+    """Database engine with the schema created once per test session"""
+    # Database tests are skipped, not errored, where the driver or server is missing
+    pytest.importorskip("psycopg2")
+    from sqlalchemy import create_engine
+    from sqlalchemy.exc import OperationalError
+    from app.db.session import Base, SQLALCHEMY_DATABASE_URL
+    
+    engine = create_engine(SQLALCHEMY_DATABASE_URL)
+    try:
+        Base.metadata.create_all(bind=engine)
+    except OperationalError as e:
+        engine.dispose()
+        pytest.skip(f"PostgreSQL not available: {e.orig}")
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def db(engine):
+    """Database session isolated in a transaction that is rolled back after the test"""
+    from sqlalchemy.orm import sessionmaker
+    
+    connection = engine.connect()
+    transaction = connection.begin()
+    # Commits inside the test release a SAVEPOINT instead of the outer transaction
+    TestingSessionLocal = sessionmaker(
+        bind=connection, autoflush=False, join_transaction_mode="create_savepoint"
+    )
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        transaction.rollback()
+        connection.close()
+
 @pytest.fixture(scope="session")
 def mock_db_session():
     """Mock database session for testing"""
     return Mock()
 
-@pytest.fixture
+# The sample data fixtures below are built once and shared read-only across the session;
+# tests that need to mutate them must take a copy first, e.g. dict(sample_company_data)
+
+@pytest.fixture(scope="session")
 def sample_emission_data():
     """Sample emission data for tests"""
-    return [
-        {
+    return (
+        MappingProxyType({
             "scope": "SCOPE_1",
             "activity_type": "Natural Gas",
             "calculated_emission": 1500.0,
             "reporting_period_start": "2024-01-01",
             "reporting_period_end": "2024-12-31"
-        }
-    ]
+        }),
+    )
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_company_data():
     """Sample company data for tests"""
-    return {
+    return MappingProxyType({
         "id": 1,
         "name": "Test Company",
         "industry_sector": "Technology",
         "country": "United States"
-    }
+    })
 
 # Remove problematic imports for now
 # We'll add them back once the structure is fixed
@@ -2,6 +2,44 @@ from locust import HttpUser, task, between
 import json
 import random
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from itertools import cycle
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# TCFD sample sections are static, so every request shares one read-only copy
+_TCFD_SAMPLE_DATA = {
+    "governance": {
+        "description": "Load test governance description"
+    },
+    "strategy": {
+        "description": "Load test strategy description"
+    }
+}
+
+# Per-request random values are drawn in bulk when a user starts and handed out in turn
+POOL_SIZE = 4096
+FRAMEWORKS = ["cdp", "tcfd", "eu_taxonomy"]
+TIME_PERIODS = ["3m", "6m", "12m"]
+TARGET_YEARS = [2030, 2035, 2040]
+# Ranges for CDP scope 1-3 emissions and reduction target, and EU revenue, capex and opex
+CDP_LOW, CDP_HIGH = [1000, 2000, 500, 30], [5000, 8000, 3000, 60]
+EU_LOW, EU_HIGH = [500000, 50000, 25000], [5000000, 500000, 250000]
+
+def _pool(values: np.ndarray):
+    """Endless iterator over pre-drawn values, converted to plain Python types"""
+    return cycle(values.tolist())
+
+def _dumps(payload) -> bytes:
+    """Serialize a request body up front; the auth headers already set Content-Type"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
 
 class ESGReportingUser(HttpUser):
     """Simulate ESG reporting user behavior for load testing"""
@@ -16,6 +54,14 @@ class ESGReportingUser(HttpUser):
         }
         self.company_id = random.randint(1, 100)
         self.created_reports = []
+        
+        rng = np.random.default_rng()
+        self._frameworks = _pool(rng.choice(FRAMEWORKS, POOL_SIZE))
+        self._time_periods = _pool(rng.choice(TIME_PERIODS, POOL_SIZE))
+        self._report_numbers = _pool(rng.integers(1000, 10000, POOL_SIZE))
+        self._target_years = _pool(rng.choice(TARGET_YEARS, POOL_SIZE))
+        self._cdp_values = _pool(rng.uniform(CDP_LOW, CDP_HIGH, (POOL_SIZE, len(CDP_LOW))))
+        self._eu_values = _pool(rng.uniform(EU_LOW, EU_HIGH, (POOL_SIZE, len(EU_LOW))))
     
     @task(3)
     def view_dashboard(self):
@@ -24,7 +70,7 @@ class ESGReportingUser(HttpUser):
             "/api/esg/dashboard/overview",
             params={
                 "company_id": self.company_id,
-                "time_period": random.choice(["3m", "6m", "12m"])
+                "time_period": next(self._time_periods)
             },
             headers=self.auth_headers,
             catch_response=True
@@ -55,10 +101,10 @@ class ESGReportingUser(HttpUser):
     @task(1)
     def create_report(self):
         """Low frequency task - create new ESG report"""
-        framework = random.choice(["cdp", "tcfd", "eu_taxonomy"])
+        framework = next(self._frameworks)
         
         report_data = {
-            "report_name": f"Load Test {framework.upper()} Report {random.randint(1000, 9999)}",
+            "report_name": f"Load Test {framework.upper()} Report {next(self._report_numbers)}",
             "framework": framework,
             "company_id": self.company_id,
             "reporting_period_start": "2024-01-01T00:00:00Z",
@@ -68,7 +114,7 @@ class ESGReportingUser(HttpUser):
         
         with self.client.post(
             "/api/esg/reports",
-            json=report_data,
+            data=_dumps(report_data),
             headers=self.auth_headers,
             catch_response=True
         ) as response:
@@ -93,7 +139,7 @@ class ESGReportingUser(HttpUser):
             
             with self.client.post(
                 f"/api/esg/reports/{report_id}/generate",
-                json={"framework": random.choice(["cdp", "tcfd", "eu_taxonomy"])},
+                data=_dumps({"framework": next(self._frameworks)}),
                 headers=self.auth_headers,
                 catch_response=True
             ) as response:
@@ -105,7 +151,7 @@ class ESGReportingUser(HttpUser):
     @task(1)
     def validate_report(self):
         """Low frequency task - validate report data"""
-        framework = random.choice(["cdp", "tcfd", "eu_taxonomy"])
+        framework = next(self._frameworks)
         
         validation_data = {
             "framework": framework,
@@ -114,7 +160,7 @@ class ESGReportingUser(HttpUser):
         
         with self.client.post(
             "/api/esg/validate",
-            json=validation_data,
+            data=_dumps(validation_data),
             headers=self.auth_headers,
             catch_response=True
         ) as response:
@@ -146,7 +192,7 @@ class ESGReportingUser(HttpUser):
             "/api/esg/dashboard/compliance-metrics",
             params={
                 "company_id": self.company_id,
-                "framework": random.choice(["cdp", "tcfd", "eu_taxonomy"])
+                "framework": next(self._frameworks)
             },
             headers=self.auth_headers,
             catch_response=True
@@ -164,7 +210,7 @@ class ESGReportingUser(HttpUser):
             
             with self.client.post(
                 f"/api/esg/reports/{report_id}/export/pdf",
-                json={"template_config": {"company_name": f"Load Test Company {self.company_id}"}},
+                data=_dumps({"template_config": {"company_name": f"Load Test Company {self.company_id}"}}),
                 headers=self.auth_headers,
                 catch_response=True,
                 timeout=60  # PDF generation can take time
@@ -177,31 +223,26 @@ class ESGReportingUser(HttpUser):
     def _generate_sample_data(self, framework):
         """Generate sample data for different frameworks"""
         if framework == "cdp":
+            scope_1, scope_2, scope_3, reduction_target = next(self._cdp_values)
             return {
                 "C6": {
-                    "scope_1_emissions": random.uniform(1000, 5000),
-                    "scope_2_emissions": random.uniform(2000, 8000),
-                    "scope_3_emissions": random.uniform(500, 3000)
+                    "scope_1_emissions": scope_1,
+                    "scope_2_emissions": scope_2,
+                    "scope_3_emissions": scope_3
                 },
                 "C4": {
-                    "reduction_target": random.uniform(30, 60),
-                    "target_year": random.choice([2030, 2035, 2040])
+                    "reduction_target": reduction_target,
+                    "target_year": next(self._target_years)
                 }
             }
         elif framework == "tcfd":
-            return {
-                "governance": {
-                    "description": "Load test governance description"
-                },
-                "strategy": {
-                    "description": "Load test strategy description"
-                }
-            }
+            return _TCFD_SAMPLE_DATA
         elif framework == "eu_taxonomy":
+            total_revenue, total_capex, total_opex = next(self._eu_values)
             return {
-                "total_revenue": random.uniform(500000, 5000000),
-                "total_capex": random.uniform(50000, 500000),
-                "total_opex": random.uniform(25000, 250000)
+                "total_revenue": total_revenue,
+                "total_capex": total_capex,
+                "total_opex": total_opex
             }
         
         return {}
@@ -216,6 +257,12 @@ class ESGAdminUser(HttpUser):
             "Authorization": "Bearer admin_token_" + str(random.randint(1000, 9999)),
             "Content-Type": "application/json"
         }
+        
+        rng = np.random.default_rng()
+        self._report_ids = _pool(rng.integers(1, 1001, POOL_SIZE))
+        self._approval_levels = _pool(rng.integers(1, 4, POOL_SIZE))
+        self._approval_actions = _pool(rng.choice(["approve", "request_changes"], POOL_SIZE))
+        self._comment_numbers = _pool(rng.integers(1, 101, POOL_SIZE))
     
     @task(5)
     def check_pending_approvals(self):
@@ -262,17 +309,17 @@ class ESGAdminUser(HttpUser):
         """Low frequency admin task - approve reports (simulation)"""
         # This would normally interact with actual pending reports
         # For load testing, we'll simulate the approval API call
-        mock_report_id = random.randint(1, 1000)
+        mock_report_id = next(self._report_ids)
         
         approval_data = {
-            "approval_level": random.randint(1, 3),
-            "action": random.choice(["approve", "request_changes"]),
-            "comments": f"Load test approval comment {random.randint(1, 100)}"
+            "approval_level": next(self._approval_levels),
+            "action": next(self._approval_actions),
+            "comments": f"Load test approval comment {next(self._comment_numbers)}"
         }
         
         with self.client.post(
             f"/api/esg/reports/{mock_report_id}/approve",
-            json=approval_data,
+            data=_dumps(approval_data),
             headers=self.auth_headers,
             catch_response=True
         ) as response:
@@ -293,6 +340,7 @@ class ESGDataSyncUser(HttpUser):
             "Authorization": "Bearer sync_token_" + str(random.randint(1000, 9999)),
             "Content-Type": "application/json"
         }
+        self._offsets = _pool(np.random.default_rng().integers(0, 501, POOL_SIZE))
     
     @task(3)
     def bulk_report_listing(self):
@@ -301,7 +349,7 @@ class ESGDataSyncUser(HttpUser):
             "/api/esg/reports",
             params={
                 "limit": 100,  # Large batch
-                "offset": random.randint(0, 500)
+                "offset": next(self._offsets)
             },
             headers=self.auth_headers,
             catch_response=True
@@ -320,16 +368,21 @@ class ESGDataSyncUser(HttpUser):
             "/api/esg/dashboard/overview"
         ]
         
-        for endpoint in endpoints:
-            with self.client.get(
-                endpoint,
-                headers=self.auth_headers,
-                catch_response=True
-            ) as response:
-                if response.status_code == 200:
-                    response.success()
-                else:
-                    response.failure(f"Health check {endpoint} failed: {response.status_code}")
+        # The checks are independent, so fan them out over the session's keep-alive pool
+        with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+            list(executor.map(self._check_health_endpoint, endpoints))
+    
+    def _check_health_endpoint(self, endpoint):
+        """Request one health endpoint and record the outcome"""
+        with self.client.get(
+            endpoint,
+            headers=self.auth_headers,
+            catch_response=True
+        ) as response:
+            if response.status_code == 200:
+                response.success()
+            else:
+                response.failure(f"Health check {endpoint} failed: {response.status_code}")
 
 # Custom load testing scenarios
 class StressTestUser(HttpUser):
@@ -1,4 +1,5 @@
 import pytest
+from app.pipeline.api_clients import EPAClient
 from app.pipeline.ingestion import DataIngestionPipeline
 from sqlalchemy.orm import Session
 
@@ -27,6 +28,25 @@ class TestDataPipeline:
         assert 'DEFRA' in results['sources']
         assert 'IPCC' in results['sources']
     
+    def test_repeated_sync_updates(self, db: Session):
+        """Test a second sync updates the factors inserted by the first"""
+        pipeline = DataIngestionPipeline(db)
+        
+        first = pipeline.run_full_sync()
+        second = pipeline.run_full_sync()
+        
+        assert first['total_processed'] > 0
+        for source, results in first['sources'].items():
+            assert results['errors'] == 0
+            assert results['inserted'] == results['processed']
+            assert results['updated'] == 0
+            
+            repeated = second['sources'][source]
+            assert repeated['errors'] == 0
+            assert repeated['processed'] == results['processed']
+            assert repeated['inserted'] == 0
+            assert repeated['updated'] == results['processed']
+    
     def test_data_transformation(self, db: Session):
         """Test data transformation"""
         pipeline = DataIngestionPipeline(db)
@@ -47,3 +67,12 @@ class TestDataPipeline:
         assert transformed[0]['scope'] == 'SCOPE_1'
         assert transformed[0]['factor_value'] == 0.5
         assert transformed[0]['unit'] == 'kg CO2e/kWh'
+    
+    def test_multi_year_fetch(self):
+        """Test concurrent multi-year fetches keep year order"""
+        client = EPAClient()
+        
+        factors = client.get_emission_factors_for_years([2022, 2023])
+        
+        assert len(factors) == 4
+        assert [factor['year'] for factor in factors] == [2022, 2022, 2023, 2023]
@@ -1,7 +1,8 @@
 import pytest
 from unittest.mock import Mock, patch
 from requests.exceptions import HTTPError, Timeout, ConnectionError
-from app.utils.error_handler import handle_api_error
+from sqlalchemy.exc import SQLAlchemyError
+from app.utils.error_handler import handle_api_error, handle_database_error
 
 class TestErrorHandling:
     
@@ -51,3 +52,18 @@ class TestErrorHandling:
         with patch('time.sleep'):
             with pytest.raises(HTTPError):
                 server_error_function()
+    
+    def test_database_error_rollback(self):
+        """Test database errors roll back the named session attribute"""
+        class Repository:
+            def __init__(self):
+                self.session = Mock()
+            
+            @handle_database_error(session_attr='session')
+            def save(self):
+                raise SQLAlchemyError("write failed")
+        
+        repository = Repository()
+        with pytest.raises(SQLAlchemyError):
+            repository.save()
+        repository.session.rollback.assert_called_once()
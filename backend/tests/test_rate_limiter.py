@@ -0,0 +1,26 @@
+import pytest
+from unittest.mock import patch
+from app.utils.rate_limiter import RateLimiter
+
+class TestRateLimiter:
+    
+    def test_burst_within_capacity(self):
+        """Test requests up to the per-minute budget pass without waiting"""
+        limiter = RateLimiter(requests_per_minute=60)
+        
+        with patch('time.sleep') as mock_sleep:
+            for _ in range(60):
+                limiter.wait_if_needed()
+            mock_sleep.assert_not_called()
+    
+    def test_waits_when_bucket_empty(self):
+        """Test the limiter waits for the next token once the bucket is empty"""
+        with patch('time.monotonic', return_value=100.0):
+            limiter = RateLimiter(requests_per_minute=60)
+            for _ in range(60):
+                assert limiter.try_acquire() == 0.0
+            
+            assert limiter.try_acquire() == pytest.approx(1.0)
+        
+        with patch('time.monotonic', return_value=101.0):
+            assert limiter.try_acquire() == 0.0